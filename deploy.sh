@@ -306,6 +306,9 @@ SCHEDULER_INTERVAL_MINUTES: "$SCHEDULER_INTERVAL"
 PUBSUB_TOPIC_NAME: "$PUBSUB_TOPIC"
 YAML_EOF
 
+# Optional pricing cache TTL (app default: 6 hours)
+[ -n "$PRICE_CACHE_TTL_HOURS" ] && echo "PRICE_CACHE_TTL_HOURS: \"$PRICE_CACHE_TTL_HOURS\"" >> "$ENV_YAML"
+
 # GCS state persistence
 [ -n "$BUDGET_STATE_BUCKET" ]   && echo "BUDGET_STATE_BUCKET: \"$BUDGET_STATE_BUCKET\""  >> "$ENV_YAML"
 
@@ -7,15 +7,19 @@ Usage:
     python3 exhaust_bigquery.py
 
 Runs full-table scans on large public datasets to burn through your
-BigQuery bytes-scanned budget quickly. Each query scans ~5-10 GB.
+BigQuery bytes-scanned budget quickly. Each round submits every scan as
+one multi-statement script, so a single job bills the sum of all scans.
 """
 
 import os
 import sys
-import time
+from multiprocessing.pool import ThreadPool
 
-PROJECT_ID = os.environ.get("GCP_PROJECT_ID", "")
-ROUNDS = int(os.environ.get("EXHAUST_ROUNDS", "10"))
+_ENV = dict(os.environ)
+PROJECT_ID = _ENV.get("GCP_PROJECT_ID", "")
+ROUNDS = int(_ENV.get("EXHAUST_ROUNDS", "10"))
+# Concurrent query jobs (scans run in parallel on the BigQuery side)
+WORKERS = int(_ENV.get("EXHAUST_WORKERS", "8"))
 
 # Public datasets with large tables (no cost to access the data,
 # but the SCAN is billed to YOUR project)
@@ -23,13 +27,22 @@ QUERIES = [
     # ~5 GB per scan (GitHub activity data)
     "SELECT COUNT(*) as cnt, type FROM `githubarchive.day.20250101` GROUP BY type",
     # ~2 GB per scan (Stack Overflow posts)
-    "SELECT COUNT(*) as cnt, LENGTH(body) as avg_len FROM `bigquery-public-data.stackoverflow.posts_answers` WHERE LENGTH(body) > 100",
+    "SELECT COUNT(*) as cnt, AVG(LENGTH(body)) as avg_len FROM `bigquery-public-data.stackoverflow.posts_answers` WHERE LENGTH(body) > 100",
     # ~8 GB per scan (Wikipedia page views)
     "SELECT wiki, SUM(views) as total_views FROM `bigquery-public-data.wikipedia.pageviews_2024` WHERE datehour > '2024-01-01' GROUP BY wiki ORDER BY total_views DESC LIMIT 100",
     # ~3 GB per scan (USA names dataset — cross join for size)
     "SELECT a.name, b.name, a.number + b.number as combined FROM `bigquery-public-data.usa_names.usa_1910_current` a CROSS JOIN (SELECT name, number FROM `bigquery-public-data.usa_names.usa_1910_current` LIMIT 1000) b LIMIT 100",
 ]
 
+# All scans as one multi-statement script, built once.  Each statement is a
+# child job that scans exactly what it would alone (no column pruning from
+# a shared wrapper), and the script job's total_bytes_billed is their sum.
+SCRIPT = ";\n".join(QUERIES) + ";"
+SCRIPT_LABEL = f"script of {len(QUERIES)} scans"
+
+# Bytes → GiB as a multiply rather than a division per progress line
+_INV_GIB = 1.0 / (1 << 30)
+
 
 def main():
     if not PROJECT_ID:
@@ -37,6 +50,7 @@ def main():
         sys.exit(1)
 
     try:
+        from google.api_core.exceptions import Forbidden, PermissionDenied
         from google.cloud import bigquery
     except ImportError:
         print("Install: pip install google-cloud-bigquery")
@@ -49,28 +63,36 @@ def main():
     print(f"Rounds:   {ROUNDS}")
     print(f"===============================\n")
 
-    total_bytes = 0
+    # Bypass the results cache so repeated queries scan (and bill) bytes again
+    job_config = bigquery.QueryJobConfig(use_query_cache=False)
 
-    for i in range(1, ROUNDS + 1):
-        query = QUERIES[(i - 1) % len(QUERIES)]
-        short_query = query[:80] + "..."
+    def run_query(i):
         try:
-            job = client.query(query)
-            result = job.result()
-            bytes_billed = job.total_bytes_billed or 0
+            job = client.query(SCRIPT, job_config=job_config)
+            job.result()
+            return i, SCRIPT_LABEL, job.total_bytes_billed or 0, None
+        except Exception as e:
+            return i, SCRIPT_LABEL, 0, e
+
+    total_bytes = 0
+    total_gb = 0.0
+
+    # The bigquery.Client is thread-safe and shared by every worker
+    with ThreadPool(processes=WORKERS) as pool:
+        for i, short_query, bytes_billed, err in pool.imap_unordered(run_query, range(1, ROUNDS + 1)):
+            if err is not None:
+                print(f"[{i}/{ROUNDS}] ERROR: {err}")
+                if isinstance(err, (PermissionDenied, Forbidden)):
+                    print("\n>>> BigQuery API appears DISABLED — Budget Guard likely triggered! <<<")
+                    break
+                continue
             total_bytes += bytes_billed
-            gb = bytes_billed / (1024 ** 3)
-            total_gb = total_bytes / (1024 ** 3)
+            gb = bytes_billed * _INV_GIB
+            total_gb += gb
             print(f"[{i}/{ROUNDS}] {gb:.2f} GB billed | cumulative: {total_gb:.2f} GB | {short_query}")
-        except Exception as e:
-            print(f"[{i}/{ROUNDS}] ERROR: {e}")
-            if "403" in str(e) or "disabled" in str(e).lower() or "Access Denied" in str(e):
-                print("\n>>> BigQuery API appears DISABLED — Budget Guard likely triggered! <<<")
-                break
-            time.sleep(1)
 
     print(f"\n=== Done ===")
-    print(f"Total bytes billed: {total_bytes:,} ({total_bytes / (1024**3):.2f} GB)")
+    print(f"Total bytes billed: {total_bytes:,} ({total_bytes * _INV_GIB:.2f} GB)")
     print(f"Check budget status: curl -X POST $URL/check")
 
 
@@ -13,14 +13,38 @@ Firestore operation budgets quickly. Cleans up after itself.
 import os
 import sys
 import time
-import uuid
+from multiprocessing.pool import ThreadPool
 
-PROJECT_ID = os.environ.get("GCP_PROJECT_ID", "")
+_ENV = dict(os.environ)
+PROJECT_ID = _ENV.get("GCP_PROJECT_ID", "")
 COLLECTION = "budget_guard_exhaust_test"
 
 # Number of write + read cycles
-WRITE_ROUNDS = int(os.environ.get("EXHAUST_WRITES", "500"))
-READ_ROUNDS = int(os.environ.get("EXHAUST_READS", "2000"))
+WRITE_ROUNDS = int(_ENV.get("EXHAUST_WRITES", "500"))
+READ_ROUNDS = int(_ENV.get("EXHAUST_READS", "2000"))
+
+# Firestore caps a single batched write at 500 operations
+BATCH_SIZE = 500
+
+# Concurrent in-flight requests (reads and batch commits are I/O-bound)
+WORKERS = int(_ENV.get("EXHAUST_WORKERS", "40"))
+
+# Independent clients (one gRPC channel each) that workers round-robin over,
+# so concurrent requests are not all multiplexed onto a single HTTP/2 channel
+CHANNELS = max(1, int(_ENV.get("EXHAUST_CHANNELS", "4")))
+
+# Constant filler shared by every document (bigger payload = more write units)
+PADDING = "x" * 500
+
+
+def _commit(job):
+    """Commit one (batch, doc_ids) pair; returns (doc_ids, error-or-None)."""
+    batch, ids = job
+    try:
+        batch.commit()
+        return ids, None
+    except Exception as e:
+        return ids, e
 
 
 def main():
@@ -29,70 +53,100 @@ def main():
         sys.exit(1)
 
     try:
+        from google.api_core.exceptions import Forbidden, PermissionDenied
         from google.cloud import firestore
     except ImportError:
         print("Install: pip install google-cloud-firestore")
         sys.exit(1)
 
-    db = firestore.Client(project=PROJECT_ID)
-    collection = db.collection(COLLECTION)
+    clients = [firestore.Client(project=PROJECT_ID) for _ in range(CHANNELS)]
+    collections = [db.collection(COLLECTION) for db in clients]
 
     print(f"=== Firestore Budget Exhaust ===")
     print(f"Project:    {PROJECT_ID}")
     print(f"Collection: {COLLECTION}")
     print(f"Writes:     {WRITE_ROUNDS}")
     print(f"Reads:      {READ_ROUNDS}")
+    print(f"Channels:   {CHANNELS}")
     print(f"================================\n")
 
+    # Clients are thread-safe; each is shared by the workers routed to it
+    pool = ThreadPool(processes=WORKERS)
     doc_ids = []
 
-    # Phase 1: Writes
+    # Phase 1: Writes (batches of up to BATCH_SIZE, committed concurrently)
     print("--- Phase 1: Writing documents ---")
-    for i in range(1, WRITE_ROUNDS + 1):
-        try:
-            doc_id = f"exhaust_{uuid.uuid4().hex[:8]}"
-            collection.document(doc_id).set({
+    # One urandom read for every ID (4 random bytes → 8 hex chars each)
+    raw = os.urandom(WRITE_ROUNDS * 4)
+    new_ids = [f"exhaust_{raw[i * 4:(i + 1) * 4].hex()}" for i in range(WRITE_ROUNDS)]
+    # Build each DocumentReference once (per client) and reuse it for
+    # write, read and delete
+    refs = [{doc_id: coll.document(doc_id) for doc_id in new_ids} for coll in collections]
+    jobs = []
+    for n, start in enumerate(range(0, WRITE_ROUNDS, BATCH_SIZE)):
+        k = n % CHANNELS
+        batch = clients[k].batch()
+        ids = []
+        now = time.time()  # one timestamp per batch
+        for i in range(start + 1, min(start + BATCH_SIZE, WRITE_ROUNDS) + 1):
+            doc_id = new_ids[i - 1]
+            batch.set(refs[k][doc_id], {
                 "index": i,
                 "data": f"Budget exhaust test document {i}",
-                "padding": "x" * 500,  # bigger payload = more write units
-                "timestamp": time.time(),
+                "padding": PADDING,
+                "timestamp": now,
             })
-            doc_ids.append(doc_id)
-            if i % 100 == 0:
-                print(f"  Written {i}/{WRITE_ROUNDS} documents")
-        except Exception as e:
-            print(f"  [{i}] WRITE ERROR: {e}")
-            if "403" in str(e) or "disabled" in str(e).lower():
-                print("\n>>> Firestore API appears DISABLED — Budget Guard likely triggered! <<<")
-                break
-            time.sleep(0.5)
+            ids.append(doc_id)
+        jobs.append((batch, ids))
+
+    for ids, err in pool.imap_unordered(_commit, jobs):
+        if err is None:
+            doc_ids.extend(ids)
+            print(f"  Written {len(doc_ids)}/{WRITE_ROUNDS} documents")
+            continue
+        print(f"  WRITE ERROR: {err}")
+        if isinstance(err, (PermissionDenied, Forbidden)):
+            print("\n>>> Firestore API appears DISABLED — Budget Guard likely triggered! <<<")
+            break
 
-    # Phase 2: Reads (read each doc multiple times)
+    # Phase 2: Reads (read each doc multiple times, fanned out over the pool)
     print(f"\n--- Phase 2: Reading documents ({READ_ROUNDS} reads) ---")
-    reads_done = 0
-    for i in range(READ_ROUNDS):
-        if not doc_ids:
-            break
-        doc_id = doc_ids[i % len(doc_ids)]
+
+    def read_one(ref):
         try:
-            doc = collection.document(doc_id).get()
-            reads_done += 1
-            if reads_done % 500 == 0:
-                print(f"  Completed {reads_done}/{READ_ROUNDS} reads")
+            ref.get()
+            return None
         except Exception as e:
-            print(f"  READ ERROR: {e}")
-            if "403" in str(e) or "disabled" in str(e).lower():
+            return e
+
+    reads_done = 0
+    if doc_ids:
+        read_refs = [
+            refs[i % CHANNELS][doc_ids[i % len(doc_ids)]] for i in range(READ_ROUNDS)
+        ]
+        for err in pool.imap_unordered(read_one, read_refs):
+            if err is None:
+                reads_done += 1
+                if reads_done % 500 == 0:
+                    print(f"  Completed {reads_done}/{READ_ROUNDS} reads")
+                continue
+            print(f"  READ ERROR: {err}")
+            if isinstance(err, (PermissionDenied, Forbidden)):
                 print("\n>>> Firestore API appears DISABLED — Budget Guard likely triggered! <<<")
                 break
-            time.sleep(0.5)
 
-    # Phase 3: Cleanup
+    # Phase 3: Cleanup (batched deletes, committed concurrently)
     print(f"\n--- Phase 3: Cleanup ({len(doc_ids)} docs) ---")
-    for doc_id in doc_ids:
-        try:
-            collection.document(doc_id).delete()
-        except Exception:
-            pass  # best-effort cleanup
+    jobs = []
+    for n, start in enumerate(range(0, len(doc_ids), BATCH_SIZE)):
+        k = n % CHANNELS
+        batch = clients[k].batch()
+        for doc_id in doc_ids[start:start + BATCH_SIZE]:
+            batch.delete(refs[k][doc_id])
+        jobs.append((batch, []))
+    pool.map(_commit, jobs)  # best-effort cleanup; errors are ignored
+    pool.close()
+    pool.join()
     print(f"  Cleanup complete")
 
     print(f"\n=== Done ===")
@@ -11,16 +11,20 @@ your Vertex AI token budget. Uses gemini-2.0-flash-lite (cheapest model)
 for rapid token consumption. Adjust ROUNDS and PROMPT_SIZE to control spend.
 """
 
+import asyncio
 import os
 import sys
-import time
 
-PROJECT_ID = os.environ.get("GCP_PROJECT_ID", "")
-REGION = os.environ.get("GCP_REGION", "us-central1")
-MODEL = os.environ.get("GEMINI_MODEL", "gemini-2.0-flash-lite")
+_ENV = dict(os.environ)
+PROJECT_ID = _ENV.get("GCP_PROJECT_ID", "")
+REGION = _ENV.get("GCP_REGION", "us-central1")
+MODEL = _ENV.get("GEMINI_MODEL", "gemini-2.0-flash-lite")
 
 # How many rounds of calls to make (each generates ~2K-4K tokens)
-ROUNDS = int(os.environ.get("EXHAUST_ROUNDS", "50"))
+ROUNDS = int(_ENV.get("EXHAUST_ROUNDS", "50"))
+
+# Maximum number of in-flight Gemini requests
+CONCURRENCY = int(_ENV.get("EXHAUST_CONCURRENCY", "8"))
 
 # Long prompt to maximize input token count per call
 LONG_PROMPT = (
@@ -38,37 +42,24 @@ def main():
 
     try:
         import vertexai
-        from vertexai.generative_models import GenerativeModel
+        from vertexai.generative_models import Content, GenerativeModel, Part
     except ImportError:
         print("Install: pip install google-cloud-aiplatform")
         sys.exit(1)
 
     vertexai.init(project=PROJECT_ID, location=REGION)
     model = GenerativeModel(MODEL)
+    # Build the request Content once instead of wrapping the str on every call
+    contents = [Content(role="user", parts=[Part.from_text(LONG_PROMPT)])]
 
     print(f"=== Vertex AI Budget Exhaust ===")
     print(f"Project:  {PROJECT_ID}")
     print(f"Model:    {MODEL}")
     print(f"Rounds:   {ROUNDS}")
+    print(f"Parallel: {CONCURRENCY}")
     print(f"================================\n")
 
-    total_input = 0
-    total_output = 0
-
-    for i in range(1, ROUNDS + 1):
-        try:
-            response = model.generate_content(LONG_PROMPT)
-            in_tokens = response.usage_metadata.prompt_token_count
-            out_tokens = response.usage_metadata.candidates_token_count
-            total_input += in_tokens
-            total_output += out_tokens
-            print(f"[{i}/{ROUNDS}] in={in_tokens} out={out_tokens} | cumulative: in={total_input} out={total_output}")
-        except Exception as e:
-            print(f"[{i}/{ROUNDS}] ERROR: {e}")
-            if "403" in str(e) or "PERMISSION_DENIED" in str(e) or "disabled" in str(e).lower():
-                print("\n>>> API appears to be DISABLED — Budget Guard likely triggered! <<<")
-                break
-            time.sleep(1)
+    total_input, total_output = asyncio.run(_exhaust(model, contents))
 
     print(f"\n=== Done ===")
     print(f"Total input tokens:  {total_input:,}")
@@ -76,5 +67,51 @@ def main():
     print(f"Check budget status: curl -X POST $URL/check")
 
 
+async def _exhaust(model, contents):
+    """Fire ROUNDS requests with at most CONCURRENCY in flight."""
+    from google.api_core.exceptions import Forbidden, PermissionDenied
+
+    sem = asyncio.Semaphore(CONCURRENCY)
+    stop = asyncio.Event()
+    # Workers push (i, in_tokens, out_tokens); a single printer task owns
+    # stdout and the cumulative counters so request tasks never block on I/O.
+    results = asyncio.Queue()
+    totals = [0, 0]  # input, output
+
+    async def printer():
+        while True:
+            item = await results.get()
+            if item is None:
+                return
+            i, in_tokens, out_tokens = item
+            totals[0] += in_tokens
+            totals[1] += out_tokens
+            print(f"[{i}/{ROUNDS}] in={in_tokens} out={out_tokens} | cumulative: in={totals[0]} out={totals[1]}")
+
+    async def one(i):
+        async with sem:
+            if stop.is_set():
+                return
+            try:
+                response = await model.generate_content_async(contents)
+            except (PermissionDenied, Forbidden) as e:
+                print(f"[{i}/{ROUNDS}] ERROR: {e}")
+                if not stop.is_set():
+                    print("\n>>> API appears to be DISABLED — Budget Guard likely triggered! <<<")
+                stop.set()
+                return
+            except Exception as e:
+                print(f"[{i}/{ROUNDS}] ERROR: {e}")
+                return
+        usage = response.usage_metadata
+        results.put_nowait((i, usage.prompt_token_count, usage.candidates_token_count))
+
+    printer_task = asyncio.create_task(printer())
+    await asyncio.gather(*(one(i) for i in range(1, ROUNDS + 1)), return_exceptions=True)
+    results.put_nowait(None)
+    await printer_task
+    return totals[0], totals[1]
+
+
 if __name__ == "__main__":
     main()
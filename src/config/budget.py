@@ -14,7 +14,7 @@ from helpers.constants import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class ServiceBudget:
     """Tracks budget vs. actual expense for a single service."""
 
@@ -34,13 +34,17 @@ class ServiceBudget:
         return self.monthly_budget > 0 and self.current_expense >= self.monthly_budget
 
     def as_dict(self) -> dict[str, Any]:
+        # Read each field once instead of going through the properties
+        expense = self.current_expense
+        budget = self.monthly_budget
+        pct = (expense / budget) * 100.0 if budget > 0 else 0.0
         return {
             "service_key": self.service_key,
             "api_name": self.api_name,
-            "monthly_budget": self.monthly_budget,
-            "current_expense": round(self.current_expense, 4),
-            "usage_pct": round(self.usage_pct, 2),
-            "is_exceeded": self.is_exceeded,
+            "monthly_budget": budget,
+            "current_expense": round(expense, 4),
+            "usage_pct": round(pct, 2),
+            "is_exceeded": budget > 0 and expense >= budget,
         }
 
 
@@ -99,9 +103,13 @@ class ProjectBudget:
         return [s for s in self.services.values() if s.is_exceeded]
 
     def as_dict(self) -> dict[str, Any]:
+        # Sum the services once for both totals
+        total = self.total_expense
+        limit = self.monthly_limit
+        pct = (total / limit) * 100.0 if limit > 0 else 0.0
         return {
-            "monthly_limit": self.monthly_limit,
-            "total_expense": round(self.total_expense, 4),
-            "total_usage_pct": round(self.total_usage_pct, 2),
+            "monthly_limit": limit,
+            "total_expense": round(total, 4),
+            "total_usage_pct": round(pct, 2),
             "services": {k: v.as_dict() for k, v in self.services.items()},
         }
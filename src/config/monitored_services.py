@@ -2,11 +2,11 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class MonitoredMetric:
     """A single Cloud Monitoring metric that contributes to a service's cost."""
 
@@ -28,7 +28,7 @@ class MonitoredMetric:
     # aggregated metric and then grouped by ``group_by_fields`` so that
     # per-model pricing can be applied at runtime.
     is_catch_all: bool = False
-    group_by_fields: list[str] = field(default_factory=list)
+    group_by_fields: tuple[str, ...] = ()
 
     # Computed at runtime
     price_per_unit: float | None = None
@@ -1,6 +1,6 @@
 """Registry of all metrics monitored per service.
 
-Each service key maps to a list of MonitoredMetric objects that will be
+Each service key maps to a tuple of MonitoredMetric objects that will be
 individually priced via the Cloud Billing Catalog API and measured via
 Cloud Monitoring.
 
@@ -19,24 +19,40 @@ In addition, seven dedicated Vertex AI sub-service metrics track:
 - Model Monitoring prediction volume
 """
 
+import sys
+from collections.abc import Mapping
+from types import MappingProxyType
+
 from config.monitored_services import MonitoredMetric
 
 # ─── Vertex AI  (service_id = C7E2-9256-1C43) ────────────────────────────────
 
-VERTEX_AI_METRICS: list[MonitoredMetric] = [
+# Billing service ids are interned: they key the Cloud Billing SKU cache, so
+# every lookup hits the identical string object.
+_VERTEX_AI_SERVICE_ID = sys.intern("C7E2-9256-1C43")
+
+_VERTEX_FILTER_TMPL = 'resource.type = "aiplatform.googleapis.com/{}"'
+
+
+def _vertex_filter(resource_type: str) -> str:
+    """Monitoring filter selecting one aiplatform.googleapis.com resource type."""
+    return _VERTEX_FILTER_TMPL.format(resource_type)
+
+
+VERTEX_AI_METRICS: tuple[MonitoredMetric, ...] = (
     # ── 1. Publisher model serving (Gemini, Claude, Llama, Mistral, …) ──────
     # Catch-all: groups by model_user_id + token_type and prices per-model.
     MonitoredMetric(
         label="Vertex AI – All Models Token Usage (catch-all)",
         metric_name="aiplatform.googleapis.com/publisher/online_serving/token_count",
-        metric_filter='resource.type = "aiplatform.googleapis.com/PublisherModel"',
-        billing_service_id="C7E2-9256-1C43",
+        metric_filter=_vertex_filter("PublisherModel"),
+        billing_service_id=_VERTEX_AI_SERVICE_ID,
         billing_sku_id="",  # resolved per-model at runtime
         is_catch_all=True,
-        group_by_fields=[
+        group_by_fields=(
             "resource.label.model_user_id",
             "metric.label.type",
-        ],
+        ),
     ),
     # ── 2. Online prediction endpoints (Dedicated Endpoint Compute) ──────────
     # Measures prediction requests served by dedicated endpoints.
@@ -47,8 +63,8 @@ VERTEX_AI_METRICS: list[MonitoredMetric] = [
     MonitoredMetric(
         label="Vertex AI – Online Prediction Endpoint Node Hours",
         metric_name="aiplatform.googleapis.com/prediction/online/accelerator/duty_cycle",
-        metric_filter='resource.type = "aiplatform.googleapis.com/Endpoint"',
-        billing_service_id="C7E2-9256-1C43",
+        metric_filter=_vertex_filter("Endpoint"),
+        billing_service_id=_VERTEX_AI_SERVICE_ID,
         billing_sku_id="VAIP-ENDPOINT-N1S4",  # n1-standard-4 equivalent node-hour
         billing_price_tier=0,
     ),
@@ -58,8 +74,8 @@ VERTEX_AI_METRICS: list[MonitoredMetric] = [
     MonitoredMetric(
         label="Vertex AI – Batch Prediction Items Processed",
         metric_name="aiplatform.googleapis.com/prediction/batch_prediction_job/prediction_count",
-        metric_filter='resource.type = "aiplatform.googleapis.com/BatchPredictionJob"',
-        billing_service_id="C7E2-9256-1C43",
+        metric_filter=_vertex_filter("BatchPredictionJob"),
+        billing_service_id=_VERTEX_AI_SERVICE_ID,
         billing_sku_id="VAIP-BATCH-PRED-ITEMS",  # per 1K items
         billing_price_tier=0,
     ),
@@ -69,8 +85,8 @@ VERTEX_AI_METRICS: list[MonitoredMetric] = [
     MonitoredMetric(
         label="Vertex AI – Custom Training Node Hours",
         metric_name="aiplatform.googleapis.com/training/node_hours",
-        metric_filter='resource.type = "aiplatform.googleapis.com/CustomJob"',
-        billing_service_id="C7E2-9256-1C43",
+        metric_filter=_vertex_filter("CustomJob"),
+        billing_service_id=_VERTEX_AI_SERVICE_ID,
         billing_sku_id="VAIP-TRAINING-N1S8",  # n1-standard-8 per node-hour
         billing_price_tier=0,
     ),
@@ -80,8 +96,8 @@ VERTEX_AI_METRICS: list[MonitoredMetric] = [
     MonitoredMetric(
         label="Vertex AI – Pipeline Component Executions",
         metric_name="aiplatform.googleapis.com/pipeline/run/step_count",
-        metric_filter='resource.type = "aiplatform.googleapis.com/PipelineJob"',
-        billing_service_id="C7E2-9256-1C43",
+        metric_filter=_vertex_filter("PipelineJob"),
+        billing_service_id=_VERTEX_AI_SERVICE_ID,
         billing_sku_id="VAIP-PIPELINE-STEP",  # per pipeline step executed
         billing_price_tier=0,
     ),
@@ -91,8 +107,8 @@ VERTEX_AI_METRICS: list[MonitoredMetric] = [
     MonitoredMetric(
         label="Vertex AI – Feature Store Online Read Ops",
         metric_name="aiplatform.googleapis.com/featurestore/online_serving/request_count",
-        metric_filter='resource.type = "aiplatform.googleapis.com/FeaturestoreOnlineServingStats"',
-        billing_service_id="C7E2-9256-1C43",
+        metric_filter=_vertex_filter("FeaturestoreOnlineServingStats"),
+        billing_service_id=_VERTEX_AI_SERVICE_ID,
         billing_sku_id="VAIP-FEATURESTORE-READ",  # per 100K reads
         billing_price_tier=0,
     ),
@@ -102,8 +118,8 @@ VERTEX_AI_METRICS: list[MonitoredMetric] = [
     MonitoredMetric(
         label="Vertex AI – Vector Search Query Ops",
         metric_name="aiplatform.googleapis.com/matching_engine/online_serving/request_count",
-        metric_filter='resource.type = "aiplatform.googleapis.com/IndexEndpoint"',
-        billing_service_id="C7E2-9256-1C43",
+        metric_filter=_vertex_filter("IndexEndpoint"),
+        billing_service_id=_VERTEX_AI_SERVICE_ID,
         billing_sku_id="VAIP-VECTOR-SEARCH-QUERY",  # per 1K queries
         billing_price_tier=0,
     ),
@@ -113,58 +129,72 @@ VERTEX_AI_METRICS: list[MonitoredMetric] = [
     MonitoredMetric(
         label="Vertex AI – Model Monitoring Predictions Analysed",
         metric_name="aiplatform.googleapis.com/model_monitoring/prediction_skew_drift/skew_drift_count",
-        metric_filter='resource.type = "aiplatform.googleapis.com/ModelDeploymentMonitoringJob"',
-        billing_service_id="C7E2-9256-1C43",
+        metric_filter=_vertex_filter("ModelDeploymentMonitoringJob"),
+        billing_service_id=_VERTEX_AI_SERVICE_ID,
         billing_sku_id="VAIP-MODEL-MONITORING-PRED",  # per 1K monitored predictions
         billing_price_tier=0,
     ),
-]
+)
 
 # ─── BigQuery  (service_id = 24E6-581D-38E5) ─────────────────────────────────
 
-BIGQUERY_METRICS: list[MonitoredMetric] = [
+_BIGQUERY_SERVICE_ID = sys.intern("24E6-581D-38E5")
+
+BIGQUERY_METRICS: tuple[MonitoredMetric, ...] = (
     MonitoredMetric(
         label="BigQuery – Scanned Bytes Billed",
         metric_name="bigquery.googleapis.com/query/statement_scanned_bytes_billed",
-        billing_service_id="24E6-581D-38E5",
+        billing_service_id=_BIGQUERY_SERVICE_ID,
         billing_sku_id="3362-E469-6BEF",
         billing_price_tier=1,  # tier-1 for on-demand analysis pricing
     ),
-]
+)
 
 # ─── Firestore  (service_id = EE2C-7FAC-5E08) ────────────────────────────────
 
-FIRESTORE_METRICS: list[MonitoredMetric] = [
+_FIRESTORE_SERVICE_ID = sys.intern("EE2C-7FAC-5E08")
+
+FIRESTORE_METRICS: tuple[MonitoredMetric, ...] = (
     MonitoredMetric(
         label="Firestore – Read Operations",
         metric_name="firestore.googleapis.com/document/read_count",
-        billing_service_id="EE2C-7FAC-5E08",
+        billing_service_id=_FIRESTORE_SERVICE_ID,
         billing_sku_id="6A94-8525-876F",
     ),
     MonitoredMetric(
         label="Firestore – Write Operations",
         metric_name="firestore.googleapis.com/document/write_count",
-        billing_service_id="EE2C-7FAC-5E08",
+        billing_service_id=_FIRESTORE_SERVICE_ID,
         billing_sku_id="BFCC-1D11-14E1",
     ),
     MonitoredMetric(
         label="Firestore – Delete Operations",
         metric_name="firestore.googleapis.com/document/delete_count",
-        billing_service_id="EE2C-7FAC-5E08",
+        billing_service_id=_FIRESTORE_SERVICE_ID,
         billing_sku_id="B813-E6E7-37F4",
     ),
     MonitoredMetric(
         label="Firestore – TTL Delete Operations",
         metric_name="firestore.googleapis.com/document/ttl_deletion_count",
-        billing_service_id="EE2C-7FAC-5E08",
+        billing_service_id=_FIRESTORE_SERVICE_ID,
         billing_sku_id="6088-280E-4225",
     ),
-]
+)
 
 # ─── Master registry keyed by service key ─────────────────────────────────────
 
-SERVICE_METRICS: dict[str, list[MonitoredMetric]] = {
+# Read-only view: the registry is fixed at import time and never mutated.
+SERVICE_METRICS: Mapping[str, tuple[MonitoredMetric, ...]] = MappingProxyType({
     "vertex_ai": VERTEX_AI_METRICS,
     "bigquery": BIGQUERY_METRICS,
     "firestore": FIRESTORE_METRICS,
-}
+})
+
+# Every Cloud Billing service whose SKUs are priced by a non-catch-all
+# metric – the catalog can list each one once, up front.
+BILLING_SERVICE_IDS: frozenset[str] = frozenset(
+    m.billing_service_id
+    for metrics in SERVICE_METRICS.values()
+    for m in metrics
+    if m.billing_service_id and not m.is_catch_all
+)
@@ -2,21 +2,23 @@
 
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+import orjson
+from fastapi import FastAPI, Response
+from fastapi.responses import ORJSONResponse
 
-from fastapi_app.routes import router
+from fastapi_app.routes import flush_notifications, router
+from helpers.constants import APP_CONFIG, APP_LOGGER
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Log configuration on startup; clean up on shutdown."""
-    try:
-        from helpers.constants import APP_CONFIG, APP_LOGGER
-
-        APP_LOGGER.info(msg=f"GCP Budget Guard config: {APP_CONFIG}")
-    except Exception as exc:
-        print(f"Warning: config load during startup: {exc}")
+    APP_LOGGER.start()
+    APP_LOGGER.info(msg=f"GCP Budget Guard config: {dict(APP_CONFIG)}")
     yield
+    # Deliver queued alerts while their log records can still be written
+    flush_notifications()
+    APP_LOGGER.stop()
 
 
 app = FastAPI(
@@ -24,13 +26,18 @@ app = FastAPI(
     description="Service-specific GCP budget monitoring & kill-switch",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 app.include_router(router)
 
 
+# Static health payload, serialised once at import
+_HEALTH_BODY = orjson.dumps({"status": "healthy", "service": "gcp-budget-guard"})
+
+
 # Health-check that responds instantly (no heavy imports)
 @app.get("/")
 @app.get("/health")
-def health():
+def health() -> Response:
     """Lightweight health probe for Cloud Run."""
-    return {"status": "healthy", "service": "gcp-budget-guard"}
+    return Response(content=_HEALTH_BODY, media_type="application/json")
@@ -11,32 +11,39 @@ POST /reset/{service}       – Full reset: re-enable API + save baseline + rese
 
 from __future__ import annotations
 
+from functools import cache
 from typing import Any
 
 from fastapi import APIRouter, Response
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from helpers.constants import APP_LOGGER, MONITORED_API_SERVICES
 
 router = APIRouter()
 
-# Lazy singleton for the heavy service
-_monitor: Any = None
+# (service_key, api_name) pairs for /status, resolved once at import
+_STATUS_TEMPLATE = tuple(MONITORED_API_SERVICES.items())
 
 
-def _get_monitor():
-    global _monitor
-    if _monitor is None:
-        from services.budget_monitor import BudgetMonitorService
+# Lazy singleton for the heavy service: built on first call, then served
+# straight from the cache
+@cache
+def _get_monitor() -> Any:
+    from services.budget_monitor import BudgetMonitorService
 
-        _monitor = BudgetMonitorService()
-    return _monitor
+    return BudgetMonitorService()
+
+
+def flush_notifications() -> None:
+    """Deliver queued alerts, if the budget monitor has been built."""
+    if _get_monitor.cache_info().currsize:
+        _get_monitor().notifications.flush()
 
 
 # ── Scheduled budget check ────────────────────────────────────────────────
 
 @router.post("/check")
-def run_budget_check() -> JSONResponse:
+def run_budget_check() -> ORJSONResponse:
     """Execute a full budget-check cycle.
 
     Called every 10 minutes by Cloud Scheduler.
@@ -44,10 +51,10 @@ def run_budget_check() -> JSONResponse:
     monitor = _get_monitor()
     try:
         result = monitor.run_check()
-        return JSONResponse(content=result, status_code=200)
+        return ORJSONResponse(content=result, status_code=200)
     except Exception as exc:
         APP_LOGGER.error(msg=f"Budget check failed: {exc}")
-        return JSONResponse(
+        return ORJSONResponse(
             content={"error": str(exc)}, status_code=500
         )
 
@@ -55,7 +62,7 @@ def run_budget_check() -> JSONResponse:
 # ── Re-enable a disabled service ─────────────────────────────────────────
 
 @router.post("/enable_service/{api_name:path}")
-def enable_service(api_name: str) -> JSONResponse:
+def enable_service(api_name: str) -> ORJSONResponse:
     """Manually re-enable a service API that was previously disabled.
 
     Example:
@@ -65,7 +72,7 @@ def enable_service(api_name: str) -> JSONResponse:
     try:
         APP_LOGGER.info(msg=f"Manual enable request: {api_name}")
         success = monitor.enable_service(api_name)
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "status": "success" if success else "failed",
                 "api_name": api_name,
@@ -75,7 +82,7 @@ def enable_service(api_name: str) -> JSONResponse:
         )
     except Exception as exc:
         APP_LOGGER.error(msg=f"Error enabling {api_name}: {exc}")
-        return JSONResponse(
+        return ORJSONResponse(
             content={"status": "error", "api_name": api_name, "message": str(exc)},
             status_code=500,
         )
@@ -84,7 +91,7 @@ def enable_service(api_name: str) -> JSONResponse:
 # ── Friendly reset by service key ────────────────────────────────────────
 
 @router.post("/reset/{service_key}")
-def reset_service(service_key: str) -> JSONResponse:
+def reset_service(service_key: str) -> ORJSONResponse:
     """Full reset: re-enable API + save cost baseline + reset alert counters.
 
     This is the proper way to recover a service after budget enforcement.
@@ -94,9 +101,10 @@ def reset_service(service_key: str) -> JSONResponse:
     Example:
         POST /reset/firestore
     """
+    service_key = service_key.lower()
     api_name = MONITORED_API_SERVICES.get(service_key)
     if not api_name:
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "status": "error",
                 "message": f"Unknown service key '{service_key}'. "
@@ -109,10 +117,10 @@ def reset_service(service_key: str) -> JSONResponse:
     try:
         result = monitor.reset_service(service_key)
         status_code = 200 if result.get("api_enabled") else 500
-        return JSONResponse(content=result, status_code=status_code)
+        return ORJSONResponse(content=result, status_code=status_code)
     except Exception as exc:
         APP_LOGGER.error(msg=f"Error resetting {service_key}: {exc}")
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "status": "error",
                 "service_key": service_key,
@@ -125,35 +133,34 @@ def reset_service(service_key: str) -> JSONResponse:
 # ── Status endpoints ─────────────────────────────────────────────────────
 
 @router.get("/status")
-def get_all_status() -> JSONResponse:
+def get_all_status() -> ORJSONResponse:
     """Return budget config and current API state for every monitored service."""
-    monitor = _get_monitor()
-    statuses = {}
-    for key, api_name in MONITORED_API_SERVICES.items():
-        statuses[key] = {
-            "api_name": api_name,
-            "api_state": monitor.get_service_status(api_name),
-        }
-    return JSONResponse(content={"services": statuses}, status_code=200)
+    get_state = _get_monitor().get_service_status
+    statuses = {
+        key: {"api_name": api_name, "api_state": get_state(api_name)}
+        for key, api_name in _STATUS_TEMPLATE
+    }
+    return ORJSONResponse(content={"services": statuses}, status_code=200)
 
 
 @router.get("/status/{service_key}")
-def get_service_status(service_key: str) -> JSONResponse:
+def get_service_status(service_key: str) -> ORJSONResponse:
     """Return API state for a single service."""
+    service_key = service_key.lower()
     api_name = MONITORED_API_SERVICES.get(service_key)
     if not api_name:
-        return JSONResponse(
+        return ORJSONResponse(
             content={"error": f"Unknown service key '{service_key}'"},
             status_code=400,
         )
     monitor = _get_monitor()
     state = monitor.get_service_status(api_name)
-    return JSONResponse(
+    return ORJSONResponse(
         content={"service_key": service_key, "api_name": api_name, "api_state": state},
         status_code=200,
     )
 
 
-@router.get("/favicon.ico")
+@router.get("/favicon.ico", include_in_schema=False)
 def favicon() -> Response:
     return Response(status_code=204)
@@ -4,25 +4,31 @@ All environment variables are validated at import time so that
 the application fails fast on startup if critical config is missing.
 """
 
+import math
 import os
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
 from helpers.logger import GCPLogger
 
+# One snapshot of the process environment; every setting below reads from it
+_ENV = dict(os.environ)
+
 # ---------------------------------------------------------------------------
 # Boolean helpers
 # ---------------------------------------------------------------------------
-TRUE_VALUES = ("true", "1", "yes")
+TRUE_VALUES = frozenset(("true", "1", "yes"))
 
 # ---------------------------------------------------------------------------
 # Logging
 # ---------------------------------------------------------------------------
-DEBUG_MODE = os.environ.get("DEBUG_MODE", "False").lower() in TRUE_VALUES
+DEBUG_MODE = _ENV.get("DEBUG_MODE", "False").lower() in TRUE_VALUES
 APP_LOGGER = GCPLogger(debug=DEBUG_MODE)
 APP_LOGGER.info(msg="GCP Budget Guard starting up …")
 
 # Dry-run mode – logs actions but never actually disables services
-DRY_RUN_MODE = os.environ.get("DRY_RUN_MODE", "False").lower() in TRUE_VALUES
+DRY_RUN_MODE = _ENV.get("DRY_RUN_MODE", "False").lower() in TRUE_VALUES
 if DRY_RUN_MODE:
     APP_LOGGER.warning(msg="DRY RUN MODE enabled – no services will be disabled")
 
@@ -32,8 +38,16 @@ if DRY_RUN_MODE:
 # LAB_MODE=True  → use static pricing, skip billing API requirements
 # PRICE_SOURCE   → "billing" (default, live Cloud Billing API with static fallback)
 #                   "static"  (static JSON catalog only)
-LAB_MODE = os.environ.get("LAB_MODE", "False").lower() in TRUE_VALUES
-PRICE_SOURCE = os.environ.get("PRICE_SOURCE", "billing").lower().strip()
+LAB_MODE = _ENV.get("LAB_MODE", "False").lower() in TRUE_VALUES
+PRICE_SOURCE = _ENV.get("PRICE_SOURCE", "billing").lower().strip()
+# Hours a service's Cloud Billing SKU list (and the prices extracted from
+# it) is reused before being re-listed.  0 disables the cache.
+PRICE_CACHE_TTL_HOURS = float(_ENV.get("PRICE_CACHE_TTL_HOURS", "6"))
+if not (math.isfinite(PRICE_CACHE_TTL_HOURS) and PRICE_CACHE_TTL_HOURS >= 0):
+    raise EnvironmentError(
+        f"PRICE_CACHE_TTL_HOURS must be a finite, non-negative number of hours, "
+        f"got {_ENV['PRICE_CACHE_TTL_HOURS']!r}"
+    )
 if LAB_MODE:
     APP_LOGGER.warning(msg="LAB MODE enabled – using static pricing (no billing API required)")
 elif PRICE_SOURCE == "static":
@@ -42,27 +56,27 @@ elif PRICE_SOURCE == "static":
 # ---------------------------------------------------------------------------
 # GCP Project
 # ---------------------------------------------------------------------------
-PROJECT_ID = os.environ.get("GCP_PROJECT_ID", "")
+PROJECT_ID = _ENV.get("GCP_PROJECT_ID", "")
 if not PROJECT_ID:
     raise EnvironmentError("GCP_PROJECT_ID environment variable is required")
 
 # ---------------------------------------------------------------------------
 # Currency
 # ---------------------------------------------------------------------------
-CURRENCY_CODE = os.environ.get("CURRENCY_CODE", "USD")
+CURRENCY_CODE = _ENV.get("CURRENCY_CODE", "USD")
 
 # ---------------------------------------------------------------------------
 # Per-service monthly budgets (in CURRENCY_CODE)
 # ---------------------------------------------------------------------------
-VERTEX_AI_MONTHLY_BUDGET = float(os.environ.get("VERTEX_AI_MONTHLY_BUDGET", "100"))
-BIGQUERY_MONTHLY_BUDGET = float(os.environ.get("BIGQUERY_MONTHLY_BUDGET", "100"))
-FIRESTORE_MONTHLY_BUDGET = float(os.environ.get("FIRESTORE_MONTHLY_BUDGET", "100"))
+VERTEX_AI_MONTHLY_BUDGET = float(_ENV.get("VERTEX_AI_MONTHLY_BUDGET", "100"))
+BIGQUERY_MONTHLY_BUDGET = float(_ENV.get("BIGQUERY_MONTHLY_BUDGET", "100"))
+FIRESTORE_MONTHLY_BUDGET = float(_ENV.get("FIRESTORE_MONTHLY_BUDGET", "100"))
 
 # ---------------------------------------------------------------------------
 # Overall project monthly budget (optional safety-net, default sum of all)
 # ---------------------------------------------------------------------------
 MONTHLY_BUDGET_AMOUNT = float(
-    os.environ.get(
+    _ENV.get(
         "MONTHLY_BUDGET_AMOUNT",
         str(VERTEX_AI_MONTHLY_BUDGET + BIGQUERY_MONTHLY_BUDGET + FIRESTORE_MONTHLY_BUDGET),
     )
@@ -71,31 +85,30 @@ MONTHLY_BUDGET_AMOUNT = float(
 # ---------------------------------------------------------------------------
 # Notification / Email
 # ---------------------------------------------------------------------------
-SMTP_SERVER = os.environ.get("SMTP_SERVER", "smtp.gmail.com")
-SMTP_PORT = int(os.environ.get("SMTP_PORT", "465"))
-SMTP_EMAIL = os.environ.get("SMTP_EMAIL", "")
-SMTP_APP_PASSWORD = os.environ.get("SMTP_APP_PASSWORD", "")
+SMTP_SERVER = _ENV.get("SMTP_SERVER", "smtp.gmail.com")
+SMTP_PORT = int(_ENV.get("SMTP_PORT", "465"))
+SMTP_EMAIL = _ENV.get("SMTP_EMAIL", "")
+SMTP_APP_PASSWORD = _ENV.get("SMTP_APP_PASSWORD", "")
 
 # Comma-separated list of recipient email addresses
-ALERT_RECEIVER_EMAILS = [
-    e.strip()
-    for e in os.environ.get("ALERT_RECEIVER_EMAILS", "").split(",")
-    if e.strip()
-]
+# (each entry is stripped exactly once; blanks are dropped)
+ALERT_RECEIVER_EMAILS = tuple(
+    e for e in map(str.strip, _ENV.get("ALERT_RECEIVER_EMAILS", "").split(",")) if e
+)
 
 # Threshold percentages
-WARNING_THRESHOLD_PCT = float(os.environ.get("WARNING_THRESHOLD_PCT", "80"))
-CRITICAL_THRESHOLD_PCT = float(os.environ.get("CRITICAL_THRESHOLD_PCT", "100"))
+WARNING_THRESHOLD_PCT = float(_ENV.get("WARNING_THRESHOLD_PCT", "80"))
+CRITICAL_THRESHOLD_PCT = float(_ENV.get("CRITICAL_THRESHOLD_PCT", "100"))
 
 # ---------------------------------------------------------------------------
 # Pub/Sub topic for budget alerts (created by deploy.sh)
 # ---------------------------------------------------------------------------
-PUBSUB_TOPIC_NAME = os.environ.get("PUBSUB_TOPIC_NAME", "budget-guard-alerts")
+PUBSUB_TOPIC_NAME = _ENV.get("PUBSUB_TOPIC_NAME", "budget-guard-alerts")
 
 # ---------------------------------------------------------------------------
 # Scheduler interval hint (informational – actual cron is set in deploy.sh)
 # ---------------------------------------------------------------------------
-SCHEDULER_INTERVAL_MINUTES = int(os.environ.get("SCHEDULER_INTERVAL_MINUTES", "10"))
+SCHEDULER_INTERVAL_MINUTES = int(_ENV.get("SCHEDULER_INTERVAL_MINUTES", "10"))
 
 # ---------------------------------------------------------------------------
 # Persistent state storage
@@ -103,10 +116,10 @@ SCHEDULER_INTERVAL_MINUTES = int(os.environ.get("SCHEDULER_INTERVAL_MINUTES", "1
 # GCS backend (recommended for production – survives Cloud Run restarts)
 # Set BUDGET_STATE_BUCKET to enable.  GCS is NOT a monitored service,
 # so NoBBomb will never disable its own state storage.
-BUDGET_STATE_BUCKET = os.environ.get("BUDGET_STATE_BUCKET", "")
-BUDGET_STATE_BLOB = os.environ.get("BUDGET_STATE_BLOB", "budget_guard_state.json")
+BUDGET_STATE_BUCKET = _ENV.get("BUDGET_STATE_BUCKET", "")
+BUDGET_STATE_BLOB = _ENV.get("BUDGET_STATE_BLOB", "budget_guard_state.json")
 # Local-file fallback (used when BUDGET_STATE_BUCKET is empty – lab / testing)
-BUDGET_STATE_PATH = os.environ.get("BUDGET_STATE_PATH", "/tmp/budget_guard_state.json")
+BUDGET_STATE_PATH = _ENV.get("BUDGET_STATE_PATH", "/tmp/budget_guard_state.json")
 
 # ---------------------------------------------------------------------------
 # Service API names (the ones we monitor and can disable)
@@ -120,7 +133,8 @@ MONITORED_API_SERVICES = {
 # ---------------------------------------------------------------------------
 # App config summary (for health-check / startup log)
 # ---------------------------------------------------------------------------
-APP_CONFIG: dict[str, Any] = {
+# Read-only: built once at import and shared by everything that logs it
+APP_CONFIG: Mapping[str, Any] = MappingProxyType({
     "project_id": PROJECT_ID,
     "currency": CURRENCY_CODE,
     "vertex_ai_budget": VERTEX_AI_MONTHLY_BUDGET,
@@ -133,8 +147,9 @@ APP_CONFIG: dict[str, Any] = {
     "debug": DEBUG_MODE,
     "lab_mode": LAB_MODE,
     "price_source": PRICE_SOURCE,
+    "price_cache_ttl_hours": PRICE_CACHE_TTL_HOURS,
     "scheduler_interval_min": SCHEDULER_INTERVAL_MINUTES,
     "state_bucket": BUDGET_STATE_BUCKET,
     "state_blob": BUDGET_STATE_BLOB,
     "state_file": BUDGET_STATE_PATH,
-}
+})
@@ -1,30 +1,109 @@
 """Structured Logger, compatible with Google Cloud Logging."""
 
+import atexit
 import json
 import logging
+import queue
+import threading
 from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any
 
+_fromtimestamp = datetime.fromtimestamp
+_UTC = timezone.utc
+
+_LEVELS = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+    "critical": logging.CRITICAL,
+}
+
+
+# Background writer shared by every GCPLogger (they share one logging.Logger)
+_listener: QueueListener | None = None
+_listener_running = False
+# Held while checking the flag and enqueueing, and while stopping, so no
+# record can be enqueued behind the listener's stop sentinel
+_listener_lock = threading.Lock()
+
+
+def _start_listener() -> None:
+    global _listener_running
+    with _listener_lock:
+        if _listener is not None and not _listener_running:
+            _listener.start()
+            _listener_running = True
+
+
+def _stop_listener() -> None:
+    global _listener_running
+    with _listener_lock:
+        if _listener is not None and _listener_running:
+            _listener_running = False
+            _listener.stop()
+
+
+class _PassthroughQueueHandler(QueueHandler):
+    """QueueHandler that enqueues records untouched.
+
+    The stock ``prepare`` pre-formats ``record.msg`` into a string, which
+    would hide the structured dict from :class:`JSONFormatter`.  Once the
+    listener has been stopped, records are written synchronously so
+    nothing logged during shutdown is lost.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def emit(self, record: logging.LogRecord) -> None:
+        with _listener_lock:
+            if _listener is None or _listener_running:
+                super().emit(record)
+                return
+        _listener.handle(record)
+
 
 class GCPLogger:
     """Structured JSON logger compatible with Google Cloud Logging."""
 
     def __init__(self, debug: bool = False) -> None:
+        global _listener
         self.logger = logging.getLogger("GCPBudgetGuard")
         if not self.logger.handlers:
             self.logger.setLevel(logging.DEBUG if debug else logging.INFO)
+            # Callers only enqueue; a single background listener thread
+            # formats records and writes them to stderr.
             handler = logging.StreamHandler()
             handler.setFormatter(JSONFormatter())
-            self.logger.addHandler(handler)
+            log_queue: queue.SimpleQueue = queue.SimpleQueue()
+            _listener = QueueListener(log_queue, handler, respect_handler_level=True)
+            _start_listener()
+            atexit.register(_stop_listener)
+            self.logger.addHandler(_PassthroughQueueHandler(log_queue))
             self.logger.propagate = False
 
+    def start(self) -> None:
+        """(Re)start the background writer thread if it is not running."""
+        _start_listener()
+
+    def stop(self) -> None:
+        """Flush queued records and stop the background writer thread."""
+        _stop_listener()
+
+    def isEnabledFor(self, level: int) -> bool:
+        """Return True if a record at *level* would actually be emitted."""
+        return self.logger.isEnabledFor(level)
+
     def _log(self, level: str, msg: str, **kwargs: Any) -> None:
-        log_entry = {
-            "message": msg,
-            "time": datetime.now(timezone.utc).isoformat(),
-            **kwargs,
-        }
-        self.logger.log(getattr(logging, level.upper()), log_entry)
+        lvl = _LEVELS[level]
+        # Skip building the entry for records below the logger's level
+        if not self.logger.isEnabledFor(lvl):
+            return
+        # "time" is filled in once, by JSONFormatter, from the record itself
+        log_entry = {"message": msg, **kwargs}
+        self.logger.log(lvl, log_entry)
 
     def debug(self, msg: str, **kwargs: Any) -> None:
         self._log("debug", msg, **kwargs)
@@ -52,5 +131,6 @@ class JSONFormatter(logging.Formatter):
             else {"message": record.getMessage()}
         )
         log_record.setdefault("severity", record.levelname)
-        log_record.setdefault("time", datetime.now(timezone.utc).isoformat())
+        if "time" not in log_record:
+            log_record["time"] = _fromtimestamp(record.created, _UTC).isoformat()
         return json.dumps(log_record)
@@ -1,6 +1,7 @@
 """Entry point – starts Uvicorn serving the FastAPI application."""
 
 import os
+import sys
 
 import uvicorn
 
@@ -8,10 +9,16 @@ from fastapi_app.app import app  # noqa: F401  (imported for uvicorn target)
 
 debug_mode = os.environ.get("DEBUG_MODE", "False").lower() in ("true", "1", "yes")
 
+# libuv event loop + C HTTP parser; neither ships for Windows, where
+# uvicorn's defaults (asyncio + h11) are kept for local development.
+_fast_io = sys.platform != "win32"
+
 if __name__ == "__main__":
     uvicorn.run(
         app="main:app",
         host="0.0.0.0",
         port=int(os.environ.get("PORT", "8080")),
         log_level="debug" if debug_mode else "info",
+        loop="uvloop" if _fast_io else "auto",
+        http="httptools" if _fast_io else "auto",
     )
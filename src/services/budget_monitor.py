@@ -12,11 +12,15 @@ It is called by the FastAPI ``/check`` endpoint on every scheduler tick.
 
 from __future__ import annotations
 
+import logging
+import time
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
-from config.budget import ProjectBudget
+from config.budget import ProjectBudget, ServiceBudget
 from config.monitored_services import MonitoredMetric
-from config.monitored_services_list import SERVICE_METRICS
+from config.monitored_services_list import BILLING_SERVICE_IDS, SERVICE_METRICS
 from helpers.constants import (
     APP_LOGGER,
     CRITICAL_THRESHOLD_PCT,
@@ -34,6 +38,27 @@ from wrappers.cloud_apis import WrapperCloudAPIs
 from wrappers.cloud_monitoring import WrapperCloudMonitoring
 
 
+# Concurrent price/usage fetches per check cycle.  A cycle has only a dozen
+# or so metrics, so a few workers already overlap the I/O waits; more would
+# just burst the Monitoring and Billing API read quotas faster.
+_FETCH_WORKERS = 4
+
+# A check cycle's raw per-service cost is reused by /reset for this long
+# instead of re-running the live pricing + monitoring sweep.
+_COST_SNAPSHOT_MAX_AGE_SECONDS = 60.0
+
+# Price result for a metric whose SKU was not looked up (no usage reported)
+_UNPRICED: tuple[float | None, bool] = (None, False)
+
+# api_name → service_key, for re-enables that arrive by API name
+_SERVICE_KEY_BY_API = {api: key for key, api in MONITORED_API_SERVICES.items()}
+
+
+def _sku_key(metric: MonitoredMetric) -> tuple[str, str, int]:
+    """Identify the billing SKU (and tier) a metric is priced by."""
+    return (metric.billing_service_id, metric.billing_sku_id, metric.billing_price_tier)
+
+
 class BudgetMonitorService:
     """Runs a full budget-check cycle for every monitored service."""
 
@@ -44,12 +69,26 @@ class BudgetMonitorService:
     ) -> None:
         self.state = state_manager or StateManager()
         self.price_provider = price_provider or create_price_provider()
+        # Load every monitored service's SKU list now rather than one
+        # service at a time inside the first check cycle
+        self.price_provider.prefetch(BILLING_SERVICE_IDS)
         self.monitoring = WrapperCloudMonitoring()
         self.apis = WrapperCloudAPIs(project_id=PROJECT_ID)
         self.notifications = NotificationService(state_manager=self.state)
 
-        # Clear baselines on month rollover (re-enable happens in run_check)
-        self._pending_rollover = self.state.check_month_rollover()
+        # The metric registry is fixed at import, so split it once:
+        # plain metrics are fetched in bulk by _prefetch_metrics, catch-all
+        # metrics each run as one task alongside them.
+        self._plain_metrics: dict[str, tuple[MonitoredMetric, ...]] = {
+            key: tuple(m for m in metrics if not m.is_catch_all)
+            for key, metrics in SERVICE_METRICS.items()
+        }
+        self._catch_all_metrics: tuple[tuple[str, MonitoredMetric], ...] = tuple(
+            (key, m) for key, metrics in SERVICE_METRICS.items() for m in metrics if m.is_catch_all
+        )
+
+        # service_key → (time.monotonic(), raw cumulative cost) from run_check
+        self._cost_snapshot: dict[str, tuple[float, float]] = {}
 
         APP_LOGGER.info(msg="BudgetMonitorService initialised.")
 
@@ -57,18 +96,18 @@ class BudgetMonitorService:
 
     def run_check(self) -> dict[str, Any]:
         """Execute a full budget check cycle.  Returns a JSON-serialisable summary."""
-        # ── Monthly rollover: clear baselines + re-enable disabled services
-        rollover = self.state.check_month_rollover()
-        if rollover or self._pending_rollover:
-            self._pending_rollover = False
-            re_enabled = self._re_enable_all_services()
-            APP_LOGGER.info(
-                msg=f"Monthly rollover: re-enabled services: {re_enabled}"
-            )
+        # Every state write of the cycle is persisted in one save at the end
+        with self.state.batch():
+            return self._run_check()
+
+    def _run_check(self) -> dict[str, Any]:
+        self._apply_month_rollover()
 
         budget = ProjectBudget()
         disabled_apis: list[str] = []
+        already_disabled: list[str] = []
         warnings_sent: list[str] = []
+        critical_sent: list[str] = []
         metric_details: list[dict[str, Any]] = []
         data_warnings: list[str] = []
 
@@ -78,6 +117,34 @@ class BudgetMonitorService:
             APP_LOGGER.warning(msg="DRY RUN – no services will be disabled")
         APP_LOGGER.info(msg="=" * 72)
 
+        # Services this guard disabled earlier in the month cannot accrue
+        # new usage while they stay disabled: carry their last known cost
+        # instead of re-querying billing and monitoring.
+        enforced = self._still_enforced_services()
+
+        # Fetch price + usage for every plain metric concurrently up front,
+        # with each catch-all metric (grouped query + per-model pricing)
+        # running beside them; the per-service loop below only aggregates.
+        catch_alls = [(key, m) for key, m in self._catch_all_metrics if key not in enforced]
+        with ThreadPoolExecutor(max_workers=max(1, len(catch_alls))) as pool:
+            catch_all_futures = [
+                pool.submit(self._compute_catch_all_expense, m, key) for key, m in catch_alls
+            ]
+            fetched = self._prefetch_metrics(
+                [
+                    m
+                    for key, metrics in self._plain_metrics.items()
+                    if key not in enforced
+                    for m in metrics
+                ]
+            )
+            catch_all_results = {
+                id(m): future.result() for (_, m), future in zip(catch_alls, catch_all_futures)
+            }
+
+        # Services at or over the warning threshold, enforced after the loop
+        breached: list[ServiceBudget] = []
+
         for service_key, metrics in SERVICE_METRICS.items():
             svc_budget = budget.services.get(service_key)
             if svc_budget is None:
@@ -85,25 +152,35 @@ class BudgetMonitorService:
 
             APP_LOGGER.info(msg=f"── Checking service: {service_key} ──")
 
-            # Compute cost for every metric that belongs to this service
-            for metric in metrics:
-                if metric.is_catch_all:
-                    cost, warns, details = self._compute_catch_all_expense(
-                        metric, service_key
-                    )
-                    svc_budget.current_expense += cost
-                    data_warnings.extend(warns)
-                    metric_details.extend(details)
-                else:
-                    warning = self._compute_metric_expense(metric)
-                    if warning:
-                        data_warnings.append(warning)
-                    svc_budget.current_expense += metric.expense
-                    metric_details.append(metric.as_dict())
+            if service_key in enforced:
+                APP_LOGGER.info(
+                    msg=f"  {service_key}: already disabled this month – skipping queries"
+                )
+                already_disabled.append(service_key)
+                raw_cumulative_cost = self.state.get_last_known_cost(service_key) or 0.0
+            else:
+                # Sum the cost of every metric that belongs to this service
+                # locally; the budget object is written once below.
+                raw_cumulative_cost = 0.0
+                for metric in metrics:
+                    if metric.is_catch_all:
+                        cost, warns, details = catch_all_results[id(metric)]
+                        raw_cumulative_cost += cost
+                        data_warnings.extend(warns)
+                        metric_details.extend(details)
+                    else:
+                        warning = self._compute_metric_expense(
+                            metric, fetched.get(id(metric))
+                        )
+                        if warning:
+                            data_warnings.append(warning)
+                        raw_cumulative_cost += metric.expense
+                        metric_details.append(metric.as_dict())
 
-            # Save raw cumulative cost for reset-baseline tracking
-            raw_cumulative_cost = svc_budget.current_expense
-            self.state.set_last_known_cost(service_key, raw_cumulative_cost)
+                # Save raw cumulative cost for reset-baseline tracking
+                self.state.set_last_known_cost(service_key, raw_cumulative_cost)
+
+            self._cost_snapshot[service_key] = (time.monotonic(), raw_cumulative_cost)
 
             # Subtract baseline (set during /reset) so the service is not
             # immediately re-disabled after an admin resets it.
@@ -117,6 +194,8 @@ class BudgetMonitorService:
                         f"${svc_budget.current_expense:.4f}"
                     )
                 )
+            else:
+                svc_budget.current_expense = raw_cumulative_cost
 
             APP_LOGGER.info(
                 msg=(
@@ -126,30 +205,31 @@ class BudgetMonitorService:
                 )
             )
 
-            # ── Warning threshold (e.g. 80 %) ────────────────────────────
-            if svc_budget.usage_pct >= WARNING_THRESHOLD_PCT and not svc_budget.is_exceeded:
-                APP_LOGGER.warning(
-                    msg=f"WARNING threshold reached for {service_key}: {svc_budget.usage_pct:.1f}%"
-                )
-                sent = self.notifications.send_warning_alert(svc_budget)
-                if sent:
-                    warnings_sent.append(service_key)
-
-            # ── Critical / exceeded threshold (e.g. 100 %) ───────────────
-            if svc_budget.is_exceeded:
-                APP_LOGGER.warning(
-                    msg=(
-                        f"BUDGET EXCEEDED for {service_key}: "
-                        f"${svc_budget.current_expense:.4f} >= ${svc_budget.monthly_budget:.2f}"
-                    )
-                )
-                # Disable only this service's API
-                success = self._disable_service(svc_budget.api_name)
-                if success:
+            if service_key in enforced:
+                continue
+            if svc_budget.usage_pct >= WARNING_THRESHOLD_PCT or svc_budget.is_exceeded:
+                breached.append(svc_budget)
+
+        # ── Enforcement: disables and alerts for every breached service run
+        # concurrently, so the cycle waits for the slowest one, not the sum.
+        if breached:
+            with ThreadPoolExecutor(max_workers=len(breached)) as pool:
+                outcomes = list(pool.map(self._enforce_budget, breached))
+            # Alerts go out on the notification worker meanwhile; wait for
+            # them so the summary lists only alerts actually delivered.
+            self.notifications.flush()
+            for svc_budget, (alert_level, disabled) in zip(breached, outcomes):
+                service_key = svc_budget.service_key
+                if alert_level and self.notifications.is_alert_sent(
+                    service_key, alert_level
+                ):
+                    if alert_level == "WARNING":
+                        warnings_sent.append(service_key)
+                    else:
+                        critical_sent.append(service_key)
+                if disabled:
                     disabled_apis.append(svc_budget.api_name)
-
-                # Send critical email
-                self.notifications.send_critical_alert(svc_budget, disabled=success)
+                    self.state.set_service_disabled(service_key, True)
 
         # ── Summary ───────────────────────────────────────────────────────
         summary = {
@@ -159,7 +239,9 @@ class BudgetMonitorService:
             "pricing_provider": self.price_provider.provider_name,
             "budget": budget.as_dict(),
             "disabled_apis": disabled_apis,
+            "already_disabled": already_disabled,
             "warnings_sent": warnings_sent,
+            "critical_sent": critical_sent,
             "metric_details": metric_details,
             "data_warnings": data_warnings,
         }
@@ -181,56 +263,149 @@ class BudgetMonitorService:
 
     # ── helpers ────────────────────────────────────────────────────────────
 
-    def _compute_metric_expense(self, metric: MonitoredMetric) -> str | None:
-        """Fetch price and usage for a single metric, compute expense.
+    def _enforce_budget(self, svc_budget: ServiceBudget) -> tuple[str | None, bool]:
+        """Alert on and, if exceeded, disable one service.
 
-        Returns a warning string if a data quality issue was detected
-        (e.g. pricing or monitoring API failure), otherwise ``None``.
-        The expense calculation itself is unchanged — price failures
-        still default to $0.00 (safe side: under-counting, not
-        over-counting).
+        Returns ``(alert_level, disabled)`` where *alert_level* is the
+        level of the alert queued for delivery, or ``None``.
         """
-        pricing_failed = False
-        monitoring_failed = False
+        service_key = svc_budget.service_key
+
+        # ── Warning threshold (e.g. 80 %) ────────────────────────────────
+        if not svc_budget.is_exceeded:
+            APP_LOGGER.warning(
+                msg=f"WARNING threshold reached for {service_key}: {svc_budget.usage_pct:.1f}%"
+            )
+            queued = self.notifications.send_warning_alert(svc_budget)
+            return ("WARNING" if queued else None), False
 
+        # ── Critical / exceeded threshold (e.g. 100 %) ───────────────────
+        APP_LOGGER.warning(
+            msg=(
+                f"BUDGET EXCEEDED for {service_key}: "
+                f"${svc_budget.current_expense:.4f} >= ${svc_budget.monthly_budget:.2f}"
+            )
+        )
+        # Disable only this service's API
+        success = self._disable_service(svc_budget.api_name)
+
+        # Send critical email
+        queued = self.notifications.send_critical_alert(svc_budget, disabled=success)
+        return ("CRITICAL" if queued else None), success
+
+    def _fetch_price(self, metric: MonitoredMetric) -> tuple[float | None, bool]:
+        """Look up a metric's SKU price.  Returns ``(price, failed)``."""
         try:
             price = self.price_provider.get_price_per_unit(
                 service_id=metric.billing_service_id,
                 sku_id=metric.billing_sku_id,
                 price_tier=metric.billing_price_tier,
             )
-            metric.price_per_unit = price
+            return price, False
         except Exception as exc:
             APP_LOGGER.error(msg=f"Pricing error for {metric.label}: {exc}")
-            metric.price_per_unit = None
-            pricing_failed = True
+            return None, True
+
+    def _fetch_prices(
+        self, metrics: Iterable[MonitoredMetric]
+    ) -> dict[tuple[str, str, int], tuple[float | None, bool]]:
+        """Price every metric's SKU with one bulk provider call.
+
+        Returns ``{sku_key: (price, failed)}``; if the bulk call raises,
+        every SKU in it is reported as failed.
+        """
+        keys = [_sku_key(m) for m in metrics]
+        if not keys:
+            return {}
+        try:
+            prices = self.price_provider.get_prices_bulk(keys)
+        except Exception as exc:
+            APP_LOGGER.error(msg=f"Bulk pricing error for {len(keys)} SKUs: {exc}")
+            return dict.fromkeys(keys, (None, True))
+        return {key: (prices.get(key), False) for key in keys}
 
+    def _fetch_units(self, metric: MonitoredMetric) -> tuple[int, bool]:
+        """Query a metric's month-to-date usage.  Returns ``(units, failed)``."""
         try:
-            metric.unit_count = self.monitoring.get_total_units(
+            units = self.monitoring.get_total_units(
                 metric_name=metric.metric_name,
                 metric_filter=metric.metric_filter,
             )
+            return units, False
         except Exception as exc:
             APP_LOGGER.error(msg=f"Monitoring error for {metric.label}: {exc}")
-            metric.unit_count = 0
-            monitoring_failed = True
+            return 0, True
+
+    def _prefetch_metrics(
+        self, metrics: Sequence[MonitoredMetric]
+    ) -> dict[int, tuple[tuple[float | None, bool], tuple[int, bool]]]:
+        """Fetch every metric's usage on a thread pool, then price them.
+
+        Usage is fetched first; only SKUs with non-zero usage (or whose
+        usage query failed) are then priced, in a single
+        :meth:`PriceProvider.get_prices_bulk` call so each SKU is priced
+        once.  Returns
+        ``{id(metric): (price_result, units_result)}`` for
+        :meth:`_compute_metric_expense`.
+        """
+        if not metrics:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(_FETCH_WORKERS, len(metrics))) as pool:
+            units = list(pool.map(self._fetch_units, metrics))
+        price_map = self._fetch_prices(
+            m for m, (count, failed) in zip(metrics, units) if count or failed
+        )
+        return {
+            id(m): (price_map.get(_sku_key(m), _UNPRICED), u)
+            for m, u in zip(metrics, units)
+        }
+
+    def _compute_metric_expense(
+        self,
+        metric: MonitoredMetric,
+        fetched: tuple[tuple[float | None, bool], tuple[int, bool]] | None = None,
+    ) -> str | None:
+        """Fetch price and usage for a single metric, compute expense.
+
+        *fetched* carries results already obtained by
+        :meth:`_prefetch_metrics`; when omitted both are fetched inline.
+
+        Returns a warning string if a data quality issue was detected
+        (e.g. pricing or monitoring API failure), otherwise ``None``.
+        The expense calculation itself is unchanged — price failures
+        still default to $0.00 (safe side: under-counting, not
+        over-counting).
+        """
+        if fetched is None:
+            units_result = self._fetch_units(metric)
+            units, failed = units_result
+            price_result = self._fetch_price(metric) if units or failed else _UNPRICED
+            fetched = (price_result, units_result)
+        (price, pricing_failed), (units, monitoring_failed) = fetched
+        metric.price_per_unit = price
+        metric.unit_count = units
 
         if metric.price_per_unit is not None:
             metric.expense = metric.price_per_unit * metric.unit_count
         else:
             metric.expense = 0.0
 
-        APP_LOGGER.debug(
-            msg=(
-                f"  {metric.label}: "
-                f"units={metric.unit_count}  "
-                f"price/unit={metric.price_per_unit}  "
-                f"expense=${metric.expense:.6f}"
+        if APP_LOGGER.isEnabledFor(logging.DEBUG):
+            APP_LOGGER.debug(
+                msg=(
+                    f"  {metric.label}: "
+                    f"units={metric.unit_count}  "
+                    f"price/unit={metric.price_per_unit}  "
+                    f"expense=${metric.expense:.6f}"
+                )
             )
-        )
 
         # ── Data quality warnings (visible in response + logs) ────────
-        price_missing = pricing_failed or metric.price_per_unit is None
+        # A missing price only matters when there is (or may be) usage
+        price_missing = pricing_failed or (
+            metric.price_per_unit is None
+            and (metric.unit_count > 0 or monitoring_failed)
+        )
         if price_missing and monitoring_failed:
             return (
                 f"⚠ {metric.label}: Both pricing and monitoring unavailable "
@@ -339,13 +514,14 @@ class BudgetMonitorService:
                 }
             )
 
-            APP_LOGGER.debug(
-                msg=(
-                    f"  {model_id}/{token_type}: "
-                    f"units={units}  price/token={price}  "
-                    f"expense=${expense:.6f} ({pricing_source})"
+            if APP_LOGGER.isEnabledFor(logging.DEBUG):
+                APP_LOGGER.debug(
+                    msg=(
+                        f"  {model_id}/{token_type}: "
+                        f"units={units}  price/token={price}  "
+                        f"expense=${expense:.6f} ({pricing_source})"
+                    )
                 )
-            )
 
         # Update the metric object for compatibility with summary logic
         metric.unit_count = sum(g.get("units", 0) for g in grouped)
@@ -353,24 +529,28 @@ class BudgetMonitorService:
 
         return total_cost, warnings, details
 
+    def _apply_month_rollover(self) -> None:
+        """On the first call of a new month, clear state and re-enable services."""
+        if self.state.check_month_rollover():
+            # Last month's cumulative costs must not become this month's
+            # reset baselines
+            self._cost_snapshot.clear()
+            re_enabled = self._re_enable_all_services()
+            APP_LOGGER.info(
+                msg=f"Monthly rollover: re-enabled services: {re_enabled}"
+            )
+
     def _re_enable_all_services(self) -> list[str]:
         """Re-enable all monitored service APIs (called on monthly rollover).
 
+        Only APIs not confirmed ENABLED are re-enabled (an unknown status
+        is treated as disabled), and every API is handled concurrently.
         Returns a list of API names that were successfully re-enabled.
         """
-        re_enabled: list[str] = []
-        for service_key, api_name in MONITORED_API_SERVICES.items():
-            try:
-                success = self.apis.enable_api(api_name=api_name)
-                if success:
-                    re_enabled.append(api_name)
-                    APP_LOGGER.info(
-                        msg=f"Monthly reset: re-enabled {api_name}"
-                    )
-            except Exception as exc:
-                APP_LOGGER.error(
-                    msg=f"Monthly reset: failed to re-enable {api_name}: {exc}"
-                )
+        api_names = list(MONITORED_API_SERVICES.values())
+        with ThreadPoolExecutor(max_workers=len(api_names)) as pool:
+            outcomes = list(pool.map(self._re_enable_if_disabled, api_names))
+        re_enabled = [api for api, success in zip(api_names, outcomes) if success]
         if re_enabled:
             self.state.record_action(
                 "monthly_reset_reenable",
@@ -378,6 +558,21 @@ class BudgetMonitorService:
             )
         return re_enabled
 
+    def _re_enable_if_disabled(self, api_name: str) -> bool:
+        """Enable *api_name* unless it is already ENABLED.  True if enabled here."""
+        try:
+            if self.apis.get_api_status(api_name=api_name) == "ENABLED":
+                return False
+            success = self.apis.enable_api(api_name=api_name)
+            if success:
+                APP_LOGGER.info(msg=f"Monthly reset: re-enabled {api_name}")
+            return success
+        except Exception as exc:
+            APP_LOGGER.error(
+                msg=f"Monthly reset: failed to re-enable {api_name}: {exc}"
+            )
+            return False
+
     def _disable_service(self, api_name: str) -> bool:
         """Disable a single API.  Respects DRY_RUN_MODE."""
         if DRY_RUN_MODE:
@@ -390,7 +585,11 @@ class BudgetMonitorService:
     def enable_service(self, api_name: str) -> bool:
         """Re-enable a service after an admin decides the budget issue is resolved."""
         APP_LOGGER.info(msg=f"Manual re-enable requested for: {api_name}")
-        return self.apis.enable_api(api_name=api_name)
+        success = self.apis.enable_api(api_name=api_name)
+        service_key = _SERVICE_KEY_BY_API.get(api_name)
+        if success and service_key is not None:
+            self.state.set_service_disabled(service_key, False)
+        return success
 
     def reset_service(self, service_key: str) -> dict[str, Any]:
         """Full reset: save cost baseline + reset alerts + re-enable API.
@@ -409,11 +608,18 @@ class BudgetMonitorService:
                 ),
             }
 
+        # A reset that lands before the month's first check cycle must not
+        # have its fresh baseline wiped by that cycle's rollover.
+        self._apply_month_rollover()
+
         # Determine the current cumulative cost to save as baseline.
-        # Always prefer a LIVE query so the baseline is accurate at the
-        # exact moment the admin resets (not stale by up to 10 minutes).
+        # A check cycle from the last minute is as good as a live query;
+        # otherwise query LIVE so the baseline is accurate at the exact
+        # moment the admin resets (not stale by up to 10 minutes).
         # Fall back to the cached cost only if the live query fails.
-        cumulative_cost = self._get_current_cumulative_cost(service_key)
+        cumulative_cost = self._recent_cumulative_cost(service_key)
+        if cumulative_cost is None:
+            cumulative_cost = self._get_current_cumulative_cost(service_key)
         if cumulative_cost is None:
             APP_LOGGER.info(
                 msg=f"Live cost query failed for {service_key} — using cached value"
@@ -468,16 +674,48 @@ class BudgetMonitorService:
 
     # ── private helpers ───────────────────────────────────────────────────
 
+    def _still_enforced_services(self) -> set[str]:
+        """Service keys disabled by this guard this month and still DISABLED.
+
+        One status call per recorded service confirms nobody re-enabled
+        it out of band; anything not confirmed is checked in full.
+        """
+        enforced: set[str] = set()
+        for service_key in self.state.get_disabled_services():
+            api_name = MONITORED_API_SERVICES.get(service_key)
+            if api_name is None:
+                continue
+            status = self.get_service_status(api_name)
+            if status == "DISABLED":
+                enforced.add(service_key)
+            elif status is not None:
+                # Re-enabled outside the guard: resume full checks
+                self.state.set_service_disabled(service_key, False)
+        return enforced
+
+    def _recent_cumulative_cost(self, service_key: str) -> float | None:
+        """Raw cost from a check cycle younger than the snapshot max age."""
+        snapshot = self._cost_snapshot.get(service_key)
+        if snapshot is None:
+            return None
+        taken_at, cost = snapshot
+        if time.monotonic() - taken_at >= _COST_SNAPSHOT_MAX_AGE_SECONDS:
+            return None
+        return cost
+
     def _get_current_cumulative_cost(self, service_key: str) -> float | None:
         """Query current month-to-date cost for a service (for baseline).
 
-        Does NOT modify any MonitoredMetric objects.
+        Returns None if any metric's Monitoring query fails, so the caller
+        falls back to the last known cost instead of saving an understated
+        baseline.  Does NOT modify any MonitoredMetric objects.
         """
-        metrics = SERVICE_METRICS.get(service_key, [])
+        metrics = SERVICE_METRICS.get(service_key, ())
         if not metrics:
             return None
 
         total = 0.0
+        prices: dict[tuple[str, str, int], float | None] = {}
         for metric in metrics:
             if metric.is_catch_all:
                 # Use grouped query for catch-all metrics
@@ -487,6 +725,12 @@ class BudgetMonitorService:
                         metric_filter=metric.metric_filter,
                         group_by_fields=metric.group_by_fields,
                     )
+                except Exception as exc:
+                    APP_LOGGER.warning(
+                        msg=f"Live query for {metric.label} failed: {exc}"
+                    )
+                    return None
+                try:
                     for group in grouped:
                         labels = group.get("labels", {})
                         model_id = labels.get("model_user_id", "unknown")
@@ -505,22 +749,32 @@ class BudgetMonitorService:
                 except Exception:
                     pass
             else:
-                try:
-                    price = self.price_provider.get_price_per_unit(
-                        service_id=metric.billing_service_id,
-                        sku_id=metric.billing_sku_id,
-                        price_tier=metric.billing_price_tier,
-                    )
-                except Exception:
-                    price = None
-
                 try:
                     units = self.monitoring.get_total_units(
                         metric_name=metric.metric_name,
                         metric_filter=metric.metric_filter,
                     )
-                except Exception:
-                    units = 0
+                except Exception as exc:
+                    APP_LOGGER.warning(
+                        msg=f"Live query for {metric.label} failed: {exc}"
+                    )
+                    return None
+                if not units:
+                    continue
+
+                key = _sku_key(metric)
+                if key in prices:
+                    price = prices[key]
+                else:
+                    try:
+                        price = self.price_provider.get_price_per_unit(
+                            service_id=metric.billing_service_id,
+                            sku_id=metric.billing_sku_id,
+                            price_tier=metric.billing_price_tier,
+                        )
+                    except Exception:
+                        price = None
+                    prices[key] = price
 
                 if price is not None:
                     total += price * units
@@ -7,22 +7,33 @@ Key design decisions
   one WARNING at 80 % budget and one CRITICAL at 100 % (only after the
   service API has actually been disabled).  No further alerts are sent
   for that service until the counter is manually reset.
-• Sends via Gmail SMTP-SSL with retry logic.
+• Sends via Gmail SMTP-SSL with retry logic, reusing one authenticated
+  connection across alerts until it goes idle or has sent its quota.
 • Publishes structured JSON alerts to a Pub/Sub topic for integration
   with downstream systems (Cloud Functions, Slack bots, etc.).
 • HTML emails with clear formatting for WARNING and CRITICAL levels.
+• Delivery runs on a background worker: callers only enqueue the alert.
+  The level is counted as sent when queued and un-counted again if every
+  channel fails, so the next check cycle retries it.
 """
 
 from __future__ import annotations
 
-import json
+import atexit
+import base64
+import queue
 import smtplib
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
+from email.header import Header
+from functools import lru_cache
+from string import Template
 from typing import Any
 
+import orjson
+
 from config.budget import ServiceBudget
 from helpers.constants import (
     ALERT_RECEIVER_EMAILS,
@@ -35,6 +46,110 @@ from helpers.constants import (
     SMTP_SERVER,
 )
 
+# Pub/Sub publishes run here so they overlap the SMTP exchange of the same
+# alert instead of waiting behind it.  Alerts drained together publish
+# concurrently and so share one batch of the client below.
+_PUBLISH_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="alert-publish")
+
+# A cached SMTP connection is replaced after this many messages, or once it
+# has sat idle this long (Gmail drops idle sessions on its own anyway).
+_SMTP_TIMEOUT_SECONDS = 10
+_SMTP_MAX_MESSAGES = 100
+_SMTP_MAX_IDLE_SECONDS = 300.0
+
+# Publisher batching: collect up to 100 messages / 40 kB for at most 50 ms
+_PUBSUB_BATCH_MAX_MESSAGES = 100
+_PUBSUB_BATCH_MAX_BYTES = 40_000
+_PUBSUB_BATCH_MAX_LATENCY_SECONDS = 0.05
+
+# Alerts waiting for the delivery worker; at most a handful per check cycle
+_ALERT_QUEUE_SIZE = 1024
+
+# Alert email HTML, parsed once; _html_body only fills in the fields
+_DISABLED_TPL = Template("""
+            <div style="background:#DC3545;color:white;padding:12px;border-radius:4px;margin:16px 0;">
+                <strong>⛔ Service Disabled:</strong> The API
+                <code>$api_name</code> has been automatically disabled
+                because it exceeded its monthly budget.
+                <br><br>
+                To re-enable, an admin can call:
+                <code>POST /enable_service/$api_name</code>
+            </div>
+            """)
+
+_BODY_TPL = Template("""
+        <html>
+        <body style="font-family:Arial,Helvetica,sans-serif;line-height:1.6;color:#333;">
+          <div style="max-width:600px;margin:0 auto;padding:20px;">
+            <div style="background:$colour;color:white;padding:20px;text-align:center;border-radius:6px;">
+              <h2 style="margin:0;">$level – Budget Alert</h2>
+              <p style="margin:4px 0 0;">GCP Budget Guard · Project <code>$project_id</code></p>
+            </div>
+
+            <div style="background:#f7f7f7;padding:20px;margin-top:16px;border-radius:6px;">
+              <table style="width:100%;border-collapse:collapse;">
+                <tr><td style="padding:8px;font-weight:bold;">Service</td>
+                    <td style="padding:8px;">$service_key</td></tr>
+                <tr><td style="padding:8px;font-weight:bold;">API</td>
+                    <td style="padding:8px;">$api_name</td></tr>
+                <tr><td style="padding:8px;font-weight:bold;">Monthly Budget</td>
+                    <td style="padding:8px;">$$$monthly_budget</td></tr>
+                <tr><td style="padding:8px;font-weight:bold;">Current Expense</td>
+                    <td style="padding:8px;color:$colour;font-weight:bold;">
+                        $$$current_expense</td></tr>
+                <tr><td style="padding:8px;font-weight:bold;">Usage</td>
+                    <td style="padding:8px;color:$colour;font-weight:bold;">
+                        ${usage_pct}%</td></tr>
+              </table>
+
+              $disabled_block
+
+              <p style="margin-top:16px;"><strong>Recommended actions:</strong></p>
+              <ul>
+                <li>Review active usage for <em>$service_key</em></li>
+                <li>Check the GCP Billing console for details</li>
+                <li>Scale down non-essential workloads if needed</li>
+                <li>To re-enable a disabled service, call the <code>/enable_service</code> endpoint</li>
+              </ul>
+            </div>
+
+            <p style="text-align:center;color:#999;font-size:12px;margin-top:16px;">
+              Sent at $ts by GCP Budget Guard · Do not reply
+            </p>
+          </div>
+        </body>
+        </html>
+        """)
+
+
+@lru_cache(maxsize=4)
+def _format_timestamps(epoch_second: int) -> tuple[str, str]:
+    """Return ``(email_ts, iso_ts)`` for a UTC second.
+
+    Alerts raised in the same check cycle share their second, so the
+    formatting is done once for all of them.
+    """
+    dt = datetime.fromtimestamp(epoch_second, timezone.utc)
+    return dt.strftime("%Y-%m-%d %H:%M:%S UTC"), dt.isoformat()
+
+
+def _render_email(subject: str, body: str) -> str:
+    """Serialise a single-part HTML email without the email.generator pass.
+
+    The body is base64-encoded and the subject RFC 2047-encoded, so the
+    result is plain ASCII whatever characters the alert contains.
+    """
+    return (
+        f"Subject: {Header(subject, 'utf-8').encode()}\r\n"
+        f"From: {SMTP_EMAIL}\r\n"
+        f"To: {', '.join(ALERT_RECEIVER_EMAILS)}\r\n"
+        "MIME-Version: 1.0\r\n"
+        'Content-Type: text/html; charset="utf-8"\r\n'
+        "Content-Transfer-Encoding: base64\r\n"
+        "\r\n"
+        + base64.encodebytes(body.encode("utf-8")).decode("ascii")
+    )
+
 
 class NotificationService:
     """Send budget alert emails and Pub/Sub messages (max 2 per service per billing cycle)."""
@@ -47,6 +162,9 @@ class NotificationService:
         # Per-service alert tracker: service_key → set of levels sent.
         # Max 2 per service: WARNING (80 %) + CRITICAL (100 % after disable).
         # Load from persistent state if available, else start empty.
+        # Guarded by _alerts_lock: the enforce pool and the delivery worker
+        # both update it.
+        self._alerts_lock = threading.Lock()
         if self._state_manager:
             saved = self._state_manager.get_alerts_sent()
             self._alerts_sent: dict[str, set[str]] = {
@@ -55,6 +173,12 @@ class NotificationService:
         else:
             self._alerts_sent: dict[str, set[str]] = {}
 
+        # ── Cached SMTP connection (see _get_smtp) ───────────────────────
+        self._smtp: smtplib.SMTP_SSL | None = None
+        self._smtp_messages = 0
+        self._smtp_last_used = 0.0
+        self._smtp_lock = threading.Lock()
+
         # ── Pub/Sub publisher ─────────────────────────────────────────────
         self._pubsub_enabled = False
         self._publisher = None
@@ -62,7 +186,15 @@ class NotificationService:
         try:
             from google.cloud import pubsub_v1
 
-            self._publisher = pubsub_v1.PublisherClient()
+            self._publisher = pubsub_v1.PublisherClient(
+                batch_settings=pubsub_v1.types.BatchSettings(
+                    max_messages=_PUBSUB_BATCH_MAX_MESSAGES,
+                    max_bytes=_PUBSUB_BATCH_MAX_BYTES,
+                    max_latency=_PUBSUB_BATCH_MAX_LATENCY_SECONDS,
+                )
+            )
+            # Runs after flush() (atexit is LIFO): sends any open batch
+            atexit.register(self._publisher.stop)
             self._topic_path = self._publisher.topic_path(PROJECT_ID, PUBSUB_TOPIC_NAME)
             self._pubsub_enabled = True
             APP_LOGGER.info(msg=f"Pub/Sub publisher ready.  Topic: {self._topic_path}")
@@ -72,6 +204,14 @@ class NotificationService:
                 "Pub/Sub alerts disabled – email-only mode."
             )
 
+        # ── Background delivery worker (started on the first alert) ───────
+        # A None item tells the worker to exit (see close()).
+        self._queue: queue.Queue[tuple[ServiceBudget, str, bool] | None] = queue.Queue(
+            maxsize=_ALERT_QUEUE_SIZE
+        )
+        self._worker: threading.Thread | None = None
+        self._worker_lock = threading.Lock()
+
         if not self._email_enabled:
             APP_LOGGER.warning(
                 msg="Email notifications disabled – SMTP_EMAIL, SMTP_APP_PASSWORD or "
@@ -85,11 +225,11 @@ class NotificationService:
     # ── public ────────────────────────────────────────────────────────────
 
     def send_warning_alert(self, svc: ServiceBudget) -> bool:
-        """Send a WARNING email (e.g. 80 % threshold)."""
+        """Queue a WARNING alert (e.g. 80 % threshold).  True if queued."""
         return self._send_alert(svc, level="WARNING")
 
     def send_critical_alert(self, svc: ServiceBudget, disabled: bool = False) -> bool:
-        """Send a CRITICAL alert (100 % + service disabled).
+        """Queue a CRITICAL alert (100 % + service disabled).  True if queued.
 
         Only fires after the service has actually been disabled.
         If *disabled* is False the alert is silently skipped so that
@@ -105,13 +245,39 @@ class NotificationService:
             return False
         return self._send_alert(svc, level="CRITICAL", disabled=disabled)
 
+    def flush(self) -> None:
+        """Block until every queued alert has been delivered (or given up on)."""
+        self._queue.join()
+
+    def close(self) -> None:
+        """Deliver queued alerts, stop the worker and drop the atexit hooks."""
+        self.flush()
+        with self._worker_lock:
+            worker, self._worker = self._worker, None
+            if worker is not None:
+                self._queue.put(None)
+        if worker is not None:
+            worker.join()
+            atexit.unregister(self.flush)
+        if self._publisher is not None:
+            atexit.unregister(self._publisher.stop)
+            self._publisher.stop()
+            self._publisher = None
+            self._pubsub_enabled = False
+
     # ── internal ──────────────────────────────────────────────────────────
 
     def _send_alert(
         self, svc: ServiceBudget, level: str, disabled: bool = False
     ) -> bool:
-        sent_levels = self._alerts_sent.get(svc.service_key, set())
-        if level in sent_levels:
+        enabled = self._email_enabled or self._pubsub_enabled
+        with self._alerts_lock:
+            sent_levels = self._alerts_sent.get(svc.service_key, set())
+            already_sent = level in sent_levels
+            if enabled and not already_sent:
+                # Count the level now so a second call cannot queue it twice
+                self._alerts_sent.setdefault(svc.service_key, set()).add(level)
+        if already_sent:
             APP_LOGGER.info(
                 msg=(
                     f"Skipping {level} alert for {svc.service_key} – "
@@ -119,9 +285,83 @@ class NotificationService:
                 )
             )
             return False
+        if not enabled:
+            return False
 
+        with self._worker_lock:
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._drain_loop, name="alert-delivery", daemon=True
+                )
+                self._worker.start()
+                atexit.register(self.flush)
+            try:
+                self._queue.put_nowait((svc, level, disabled))
+            except queue.Full:
+                APP_LOGGER.error(
+                    msg=f"Alert queue full – dropping {level} alert for {svc.service_key}"
+                )
+                self._uncount(svc.service_key, level)
+                return False
+        return True
+
+    def _uncount(self, service_key: str, level: str) -> None:
+        """Forget an optimistically counted alert so it can be retried."""
+        with self._alerts_lock:
+            self._alerts_sent.get(service_key, set()).discard(level)
+
+    def _drain_loop(self) -> None:
+        """Worker thread: deliver queued alerts, everything waiting at once."""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                self._queue.task_done()
+                return
+            batch = [item]
+            stop = False
+            while True:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    self._queue.task_done()
+                    stop = True
+                    break
+                batch.append(item)
+            try:
+                self._deliver_batch(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+            if stop:
+                return
+
+    def _deliver_batch(self, batch: list[tuple[ServiceBudget, str, bool]]) -> None:
+        """Publish every alert of *batch* together, then email them in turn."""
+        # ── Pub/Sub (in the background while the emails go out) ──────────
+        publishes = [
+            _PUBLISH_EXECUTOR.submit(self._publish_to_pubsub, level, svc, disabled)
+            for svc, level, disabled in batch
+        ]
+        for (svc, level, disabled), pubsub_future in zip(batch, publishes):
+            try:
+                self._deliver(svc, level, disabled, pubsub_future)
+            except Exception as exc:
+                APP_LOGGER.error(
+                    msg=f"Alert delivery failed for {svc.service_key}: {exc}"
+                )
+                self._uncount(svc.service_key, level)
+
+    def _deliver(
+        self,
+        svc: ServiceBudget,
+        level: str,
+        disabled: bool,
+        pubsub_future: Future[bool],
+    ) -> bool:
+        """Email one alert, await its publish and settle its counter."""
         email_sent = False
-        pubsub_sent = False
 
         # ── Email ─────────────────────────────────────────────────────────
         if self._email_enabled:
@@ -129,24 +369,35 @@ class NotificationService:
             body = self._html_body(level, svc, disabled)
             email_sent = self._send_email(subject, body)
 
-        # ── Pub/Sub ───────────────────────────────────────────────────────
-        pubsub_sent = self._publish_to_pubsub(level, svc, disabled)
+        pubsub_sent = pubsub_future.result()
 
         sent = email_sent or pubsub_sent
         if sent:
-            self._alerts_sent.setdefault(svc.service_key, set()).add(level)
             # Persist to state manager so alerts survive container restarts
             if self._state_manager:
                 self._state_manager.set_alert_sent(svc.service_key, level)
+        else:
+            # Nothing went out: let the next check cycle try again
+            self._uncount(svc.service_key, level)
         return sent
 
+    def is_alert_sent(self, service_key: str, level: str) -> bool:
+        """True if *level* is counted as sent for the service.
+
+        After :meth:`flush` this means the alert was actually delivered.
+        """
+        with self._alerts_lock:
+            return level in self._alerts_sent.get(service_key, ())
+
     def get_alert_count(self, service_key: str) -> int:
         """Return the number of alerts already sent for a service (max 2)."""
-        return len(self._alerts_sent.get(service_key, set()))
+        with self._alerts_lock:
+            return len(self._alerts_sent.get(service_key, set()))
 
     def reset_alerts(self, service_key: str) -> None:
         """Reset alert tracking for a service, allowing new alerts."""
-        self._alerts_sent.pop(service_key, None)
+        with self._alerts_lock:
+            self._alerts_sent.pop(service_key, None)
         if self._state_manager:
             self._state_manager.reset_alerts(service_key)
         APP_LOGGER.info(msg=f"Alert counters reset for service: {service_key}")
@@ -162,82 +413,39 @@ class NotificationService:
     def _html_body(
         self, level: str, svc: ServiceBudget, disabled: bool
     ) -> str:
-        colour = "#FFA500" if level == "WARNING" else "#DC3545"
-        ts = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
-
-        disabled_block = ""
-        if disabled:
-            disabled_block = f"""
-            <div style="background:#DC3545;color:white;padding:12px;border-radius:4px;margin:16px 0;">
-                <strong>⛔ Service Disabled:</strong> The API
-                <code>{svc.api_name}</code> has been automatically disabled
-                because it exceeded its monthly budget.
-                <br><br>
-                To re-enable, an admin can call:
-                <code>POST /enable_service/{svc.api_name}</code>
-            </div>
-            """
-
-        return f"""
-        <html>
-        <body style="font-family:Arial,Helvetica,sans-serif;line-height:1.6;color:#333;">
-          <div style="max-width:600px;margin:0 auto;padding:20px;">
-            <div style="background:{colour};color:white;padding:20px;text-align:center;border-radius:6px;">
-              <h2 style="margin:0;">{level} – Budget Alert</h2>
-              <p style="margin:4px 0 0;">GCP Budget Guard · Project <code>{PROJECT_ID}</code></p>
-            </div>
-
-            <div style="background:#f7f7f7;padding:20px;margin-top:16px;border-radius:6px;">
-              <table style="width:100%;border-collapse:collapse;">
-                <tr><td style="padding:8px;font-weight:bold;">Service</td>
-                    <td style="padding:8px;">{svc.service_key}</td></tr>
-                <tr><td style="padding:8px;font-weight:bold;">API</td>
-                    <td style="padding:8px;">{svc.api_name}</td></tr>
-                <tr><td style="padding:8px;font-weight:bold;">Monthly Budget</td>
-                    <td style="padding:8px;">${svc.monthly_budget:.2f}</td></tr>
-                <tr><td style="padding:8px;font-weight:bold;">Current Expense</td>
-                    <td style="padding:8px;color:{colour};font-weight:bold;">
-                        ${svc.current_expense:.4f}</td></tr>
-                <tr><td style="padding:8px;font-weight:bold;">Usage</td>
-                    <td style="padding:8px;color:{colour};font-weight:bold;">
-                        {svc.usage_pct:.1f}%</td></tr>
-              </table>
-
-              {disabled_block}
-
-              <p style="margin-top:16px;"><strong>Recommended actions:</strong></p>
-              <ul>
-                <li>Review active usage for <em>{svc.service_key}</em></li>
-                <li>Check the GCP Billing console for details</li>
-                <li>Scale down non-essential workloads if needed</li>
-                <li>To re-enable a disabled service, call the <code>/enable_service</code> endpoint</li>
-              </ul>
-            </div>
-
-            <p style="text-align:center;color:#999;font-size:12px;margin-top:16px;">
-              Sent at {ts} by GCP Budget Guard · Do not reply
-            </p>
-          </div>
-        </body>
-        </html>
-        """
+        return _BODY_TPL.substitute(
+            colour="#FFA500" if level == "WARNING" else "#DC3545",
+            level=level,
+            project_id=PROJECT_ID,
+            service_key=svc.service_key,
+            api_name=svc.api_name,
+            monthly_budget=f"{svc.monthly_budget:.2f}",
+            current_expense=f"{svc.current_expense:.4f}",
+            usage_pct=f"{svc.usage_pct:.1f}",
+            disabled_block=(
+                _DISABLED_TPL.substitute(api_name=svc.api_name) if disabled else ""
+            ),
+            ts=_format_timestamps(int(time.time()))[0],
+        )
 
     def _send_email(self, subject: str, body: str, max_retries: int = 3) -> bool:
         """Send HTML email to all recipients via SMTP-SSL with retries."""
+        raw = _render_email(subject, body)
+
         for attempt in range(1, max_retries + 1):
             try:
-                msg = MIMEMultipart("alternative")
-                msg["Subject"] = subject
-                msg["From"] = SMTP_EMAIL
-                msg["To"] = ", ".join(ALERT_RECEIVER_EMAILS)
-                msg.attach(MIMEText(body, "html"))
-
-                with smtplib.SMTP_SSL(SMTP_SERVER, SMTP_PORT) as server:
-                    server.login(SMTP_EMAIL, SMTP_APP_PASSWORD)
-                    server.sendmail(
-                        SMTP_EMAIL, ALERT_RECEIVER_EMAILS, msg.as_string()
+                with self._smtp_lock:
+                    server = self._get_smtp()
+                    # Raises only if every recipient is refused; partial
+                    # refusals come back as {address: (code, reply)}
+                    refused = server.sendmail(SMTP_EMAIL, ALERT_RECEIVER_EMAILS, raw)
+                    self._smtp_messages += 1
+                    self._smtp_last_used = time.monotonic()
+
+                if refused:
+                    APP_LOGGER.warning(
+                        msg=f"Email recipients refused by SMTP server: {sorted(refused)}"
                     )
-
                 APP_LOGGER.info(
                     msg=f"Email sent to {ALERT_RECEIVER_EMAILS}: {subject}"
                 )
@@ -247,12 +455,54 @@ class NotificationService:
                 APP_LOGGER.error(
                     msg=f"Email send attempt {attempt}/{max_retries} failed: {exc}"
                 )
+                # Retry on a fresh connection
+                with self._smtp_lock:
+                    self._close_smtp()
                 if attempt < max_retries:
                     time.sleep(2 ** attempt)
 
         APP_LOGGER.error(msg=f"All email attempts failed for: {subject}")
         return False
 
+    def _get_smtp(self) -> smtplib.SMTP_SSL:
+        """Return a logged-in SMTP connection, reusing the cached one if live.
+
+        Must be called with ``_smtp_lock`` held.
+        """
+        if self._smtp is not None:
+            stale = (
+                self._smtp_messages >= _SMTP_MAX_MESSAGES
+                or time.monotonic() - self._smtp_last_used > _SMTP_MAX_IDLE_SECONDS
+            )
+            if not stale:
+                try:
+                    if self._smtp.noop()[0] == 250:
+                        return self._smtp
+                except (smtplib.SMTPException, OSError):
+                    pass
+            self._close_smtp()
+
+        server = smtplib.SMTP_SSL(SMTP_SERVER, SMTP_PORT, timeout=_SMTP_TIMEOUT_SECONDS)
+        try:
+            server.login(SMTP_EMAIL, SMTP_APP_PASSWORD)
+        except Exception:
+            server.close()
+            raise
+        self._smtp = server
+        self._smtp_messages = 0
+        self._smtp_last_used = time.monotonic()
+        return server
+
+    def _close_smtp(self) -> None:
+        """Drop the cached SMTP connection.  Must be called with the lock held."""
+        if self._smtp is None:
+            return
+        try:
+            self._smtp.quit()
+        except Exception:
+            self._smtp.close()
+        self._smtp = None
+
     # ── Pub/Sub ───────────────────────────────────────────────────────────
 
     def _publish_to_pubsub(
@@ -262,7 +512,7 @@ class NotificationService:
         if not self._pubsub_enabled or self._publisher is None:
             return False
 
-        ts = datetime.now(timezone.utc).isoformat()
+        ts = _format_timestamps(int(time.time()))[1]
         alert_payload = {
             "project_id": PROJECT_ID,
             "alert_type": level,
@@ -283,13 +533,24 @@ class NotificationService:
             alert_payload["action_taken"] = f"Disabled API: {svc.api_name}"
             alert_payload["re_enable_endpoint"] = f"POST /reset/{svc.service_key}"
 
+        # Scalar routing fields are repeated as attributes so subscription
+        # filters (e.g. attributes.alert_type = "CRITICAL") need not parse JSON
+        attributes = {
+            "project_id": PROJECT_ID,
+            "alert_type": level,
+            "service_key": svc.service_key,
+            "api_name": svc.api_name,
+            "service_disabled": "true" if disabled else "false",
+            "usage_pct": f"{svc.usage_pct:.2f}",
+            "current_expense": f"{svc.current_expense:.4f}",
+            "monthly_budget": f"{svc.monthly_budget:.2f}",
+            "timestamp": ts,
+        }
+
         try:
-            data = json.dumps(alert_payload).encode("utf-8")
+            data = orjson.dumps(alert_payload)
             future = self._publisher.publish(
-                self._topic_path,
-                data=data,
-                alert_type=level,
-                service_key=svc.service_key,
+                self._topic_path, data=data, **attributes
             )
             message_id = future.result(timeout=10)
             APP_LOGGER.info(
@@ -8,11 +8,13 @@ fallback when the billing API is unavailable.
 
 from __future__ import annotations
 
-import json
+import logging
 import os
 from pathlib import Path
 from typing import Any
 
+import orjson
+
 from helpers.constants import APP_LOGGER
 
 # Default catalog path: config/pricing_catalog.json relative to this file
@@ -24,6 +26,13 @@ _DEFAULT_CATALOG_PATH = str(
 _REQUIRED_KEYS = {"version", "region", "currency", "vertex_ai", "bigquery", "firestore"}
 
 
+def _per_base_unit(entry: dict[str, Any]) -> float:
+    """Normalise a catalog entry's ``price_per_unit`` to one base unit."""
+    price_per_unit = float(entry.get("price_per_unit", 0))
+    unit_size = int(entry.get("unit_size", 1))
+    return price_per_unit / unit_size if unit_size > 0 else 0.0
+
+
 class PriceCatalogService:
     """Load and query the static pricing catalog.
 
@@ -45,6 +54,10 @@ class PriceCatalogService:
         )
         self._data: dict[str, Any] = {}
         self._sku_index: dict[str, dict[str, Any]] = {}  # sku_id → pricing entry
+        # sku_id → price per base unit, precomputed from _sku_index at load
+        self._price_index: dict[str, float] = {}
+        # (model_key, token_type) → price per single token, precomputed at load
+        self._model_prices: dict[tuple[str, str], float] = {}
         self._load_catalog()
 
     # ── public API ────────────────────────────────────────────────────────
@@ -92,19 +105,16 @@ class PriceCatalogService:
             Price per base unit, or None if SKU not found and
             use_fallback is False.
         """
-        entry = self._sku_index.get(sku_id)
+        price_per_base = self._price_index.get(sku_id)
 
-        if entry is not None:
-            price_per_unit = float(entry.get("price_per_unit", 0))
-            unit_size = int(entry.get("unit_size", 1))
-            price_per_base = price_per_unit / unit_size if unit_size > 0 else 0.0
-
-            APP_LOGGER.debug(
-                msg=(
-                    f"Static price for {service_key}/{sku_id}: "
-                    f"{price_per_unit}/{unit_size} = {price_per_base:.12f} per base unit"
+        if price_per_base is not None:
+            if APP_LOGGER.isEnabledFor(logging.DEBUG):
+                APP_LOGGER.debug(
+                    msg=(
+                        f"Static price for {service_key}/{sku_id}: "
+                        f"{price_per_base:.12f} per base unit"
+                    )
                 )
-            )
             return price_per_base
 
         APP_LOGGER.warning(
@@ -138,17 +148,15 @@ class PriceCatalogService:
         Returns:
             Price per single token, or the default fallback price.
         """
-        vertex_ai = self._data.get("vertex_ai", {})
-
         # 1. Exact match
-        price = self._extract_model_token_price(vertex_ai, model_id, token_type)
+        price = self._model_prices.get((model_id, token_type))
         if price is not None:
             return price
 
         # 2. Normalised match
         normalised = self._normalize_model_id(model_id)
         if normalised != model_id:
-            price = self._extract_model_token_price(vertex_ai, normalised, token_type)
+            price = self._model_prices.get((normalised, token_type))
             if price is not None:
                 return price
 
@@ -192,21 +200,6 @@ class PriceCatalogService:
             model_id = model_id.split("@")[0]
         return model_id
 
-    @staticmethod
-    def _extract_model_token_price(
-        vertex_ai_data: dict[str, Any], model_key: str, token_type: str
-    ) -> float | None:
-        """Look up a model's per-token price from the catalog section."""
-        model_data = vertex_ai_data.get(model_key)
-        if model_data is None:
-            return None
-        entry = model_data.get(token_type)
-        if entry is None:
-            return None
-        price_per_unit = float(entry.get("price_per_unit", 0))
-        unit_size = int(entry.get("unit_size", 1))
-        return price_per_unit / unit_size if unit_size > 0 else 0.0
-
     def get_vertex_ai_service_price(
         self,
         sku_id: str,
@@ -234,17 +227,15 @@ class PriceCatalogService:
         """
         # Fast path: check the flat index first (vertex_ai_services entries
         # are indexed there alongside bigquery / firestore entries)
-        entry = self._sku_index.get(sku_id)
-        if entry is not None:
-            price_per_unit = float(entry.get("price_per_unit", 0))
-            unit_size = int(entry.get("unit_size", 1))
-            price_per_base = price_per_unit / unit_size if unit_size > 0 else 0.0
-            APP_LOGGER.debug(
-                msg=(
-                    f"Static Vertex AI service price for SKU {sku_id}: "
-                    f"{price_per_unit}/{unit_size} = {price_per_base:.10f} per base unit"
+        price_per_base = self._price_index.get(sku_id)
+        if price_per_base is not None:
+            if APP_LOGGER.isEnabledFor(logging.DEBUG):
+                APP_LOGGER.debug(
+                    msg=(
+                        f"Static Vertex AI service price for SKU {sku_id}: "
+                        f"{price_per_base:.10f} per base unit"
+                    )
                 )
-            )
             return price_per_base
 
         # Slow path: scan vertex_ai_services by sku_id field value
@@ -253,14 +244,13 @@ class PriceCatalogService:
             if not isinstance(svc_entry, dict):
                 continue
             if svc_entry.get("sku_id") == sku_id:
-                price_per_unit = float(svc_entry.get("price_per_unit", 0))
-                unit_size = int(svc_entry.get("unit_size", 1))
-                price_per_base = price_per_unit / unit_size if unit_size > 0 else 0.0
+                price_per_base = _per_base_unit(svc_entry)
                 # Cache for next call
                 self._sku_index[sku_id] = {
-                    "price_per_unit": price_per_unit,
-                    "unit_size": unit_size,
+                    "price_per_unit": float(svc_entry.get("price_per_unit", 0)),
+                    "unit_size": int(svc_entry.get("unit_size", 1)),
                 }
+                self._price_index[sku_id] = price_per_base
                 return price_per_base
 
         APP_LOGGER.warning(
@@ -322,15 +312,14 @@ class PriceCatalogService:
         APP_LOGGER.info(msg=f"Loading static pricing catalog from: {self._catalog_path}")
 
         try:
-            with open(self._catalog_path, "r", encoding="utf-8") as fh:
-                self._data = json.load(fh)
+            self._data = orjson.loads(Path(self._catalog_path).read_bytes())
         except FileNotFoundError:
             APP_LOGGER.error(
                 msg=f"Pricing catalog not found: {self._catalog_path}"
             )
             self._data = {}
             return
-        except json.JSONDecodeError as exc:
+        except orjson.JSONDecodeError as exc:
             APP_LOGGER.error(
                 msg=f"Invalid JSON in pricing catalog: {exc}"
             )
@@ -341,6 +330,7 @@ class PriceCatalogService:
             APP_LOGGER.warning(msg="Pricing catalog schema validation failed – partial data may be used")
 
         self._build_sku_index()
+        self._build_model_price_index()
 
         APP_LOGGER.info(
             msg=(
@@ -363,10 +353,11 @@ class PriceCatalogService:
     def _build_sku_index(self) -> None:
         """Build a flat sku_id → pricing-entry index across all services."""
         self._sku_index = {}
+        debug = APP_LOGGER.isEnabledFor(logging.DEBUG)
 
         for service_key in ("vertex_ai", "bigquery", "firestore"):
             service_data = self._data.get(service_key, {})
-            self._index_service_entries(service_key, service_data)
+            self._index_service_entries(service_key, service_data, debug)
 
         # Index vertex_ai_services (keyed by sku_id field, not billing_sku_id)
         for svc_name, svc_entry in self._data.get("vertex_ai_services", {}).items():
@@ -378,33 +369,56 @@ class PriceCatalogService:
                     "price_per_unit": svc_entry.get("price_per_unit", 0),
                     "unit_size": svc_entry.get("unit_size", 1),
                 }
-                APP_LOGGER.debug(
-                    msg=f"Indexed vertex_ai_service: {svc_name} → SKU {sku_id}"
-                )
+                if debug:
+                    APP_LOGGER.debug(
+                        msg=f"Indexed vertex_ai_service: {svc_name} → SKU {sku_id}"
+                    )
 
-        APP_LOGGER.debug(
-            msg=f"Built SKU index with {len(self._sku_index)} entries"
-        )
+        self._price_index = {
+            sku_id: _per_base_unit(entry) for sku_id, entry in self._sku_index.items()
+        }
 
-    def _index_service_entries(
-        self, service_key: str, data: dict[str, Any], prefix: str = ""
-    ) -> None:
-        """Recursively index pricing entries that contain a billing_sku_id."""
-        for key, value in data.items():
-            if not isinstance(value, dict):
+        if debug:
+            APP_LOGGER.debug(
+                msg=f"Built SKU index with {len(self._sku_index)} entries"
+            )
+
+    def _build_model_price_index(self) -> None:
+        """Precompute the per-token price of every model in ``vertex_ai``."""
+        self._model_prices = {}
+        for model_key, model_data in self._data.get("vertex_ai", {}).items():
+            if not isinstance(model_data, dict):
                 continue
+            for token_type, entry in model_data.items():
+                if not isinstance(entry, dict):
+                    continue
+                self._model_prices[(model_key, token_type)] = _per_base_unit(entry)
 
-            current_prefix = f"{prefix}{key}/" if prefix else f"{key}/"
+    def _index_service_entries(
+        self, service_key: str, data: dict[str, Any], debug: bool = False
+    ) -> None:
+        """Index pricing entries that contain a billing_sku_id, at any depth.
 
-            if "billing_sku_id" in value and "price_per_unit" in value:
-                sku_id = value["billing_sku_id"]
-                self._sku_index[sku_id] = value
-                APP_LOGGER.debug(
-                    msg=(
-                        f"Indexed: {service_key}/{current_prefix.rstrip('/')} "
-                        f"→ SKU {sku_id}"
-                    )
-                )
+        Walks nested dicts (e.g. model → input/output) depth-first in
+        document order with an explicit stack of item iterators, so a
+        duplicate SKU resolves exactly as it did with recursion.
+        """
+        stack = [("", iter(data.items()))]
+        while stack:
+            prefix, items = stack[-1]
+            for key, value in items:
+                if not isinstance(value, dict):
+                    continue
+                if "billing_sku_id" in value and "price_per_unit" in value:
+                    sku_id = value["billing_sku_id"]
+                    self._sku_index[sku_id] = value
+                    if debug:
+                        APP_LOGGER.debug(
+                            msg=f"Indexed: {service_key}/{prefix}{key} → SKU {sku_id}"
+                        )
+                else:
+                    # Descend; this level resumes after the nested dict
+                    stack.append((f"{prefix}{key}/", iter(value.items())))
+                    break
             else:
-                # Recurse into nested dicts (e.g. model → input/output)
-                self._index_service_entries(service_key, value, current_prefix)
+                stack.pop()
@@ -19,6 +19,7 @@ The factory function :func:`create_price_provider` encapsulates this logic.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
 from typing import Any
 
 from helpers.constants import APP_LOGGER
@@ -64,6 +65,33 @@ class PriceProvider(ABC):
         """Serialisable summary for status endpoints."""
         return {"provider": self.provider_name}
 
+    def get_prices_bulk(
+        self, keys: Iterable[tuple[str, str, int]]
+    ) -> dict[tuple[str, str, int], float | None]:
+        """Return prices for many ``(service_id, sku_id, price_tier)`` keys.
+
+        Duplicate keys are looked up once.  The default implementation
+        calls :meth:`get_price_per_unit` per key; providers backed by a
+        remote catalog override it to load each service's SKUs in one go.
+        """
+        return {
+            key: self.get_price_per_unit(*key) for key in dict.fromkeys(keys)
+        }
+
+    def prefetch(self, service_ids: Iterable[str]) -> None:
+        """Warm any pricing data for *service_ids* ahead of the first lookup.
+
+        The default implementation does nothing; providers backed by a
+        remote catalog override it to load SKU lists in bulk.
+        """
+
+    def invalidate_prices(self) -> None:
+        """Discard cached prices so the next lookups hit the source again.
+
+        The default implementation does nothing; caching providers
+        override it.
+        """
+
     def get_vertex_ai_token_price(
         self, model_id: str, token_type: str
     ) -> float | None:
@@ -109,6 +137,20 @@ class CloudBillingPriceProvider(PriceProvider):
             price_tier=price_tier,
         )
 
+    def get_prices_bulk(
+        self, keys: Iterable[tuple[str, str, int]]
+    ) -> dict[tuple[str, str, int], float | None]:
+        keys = list(dict.fromkeys(keys))
+        # One SKU listing per distinct service; the lookups below are local
+        self._billing.prefetch({service_id for service_id, _, _ in keys})
+        return super().get_prices_bulk(keys)
+
+    def prefetch(self, service_ids: Iterable[str]) -> None:
+        self._billing.prefetch(service_ids)
+
+    def invalidate_prices(self) -> None:
+        self._billing.invalidate()
+
     def as_dict(self) -> dict[str, Any]:
         return {"provider": self.provider_name, "source": "Cloud Billing Catalog API"}
 
@@ -245,6 +287,28 @@ class FallbackPriceProvider(PriceProvider):
             )
             return None
 
+    def get_prices_bulk(
+        self, keys: Iterable[tuple[str, str, int]]
+    ) -> dict[tuple[str, str, int], float | None]:
+        keys = list(dict.fromkeys(keys))
+        # Load the primary's catalogs in bulk, then resolve (and fall
+        # back) key by key
+        self.prefetch({service_id for service_id, _, _ in keys})
+        return super().get_prices_bulk(keys)
+
+    def prefetch(self, service_ids: Iterable[str]) -> None:
+        # Only the primary is remote; the static fallback is already in memory
+        try:
+            self._primary.prefetch(service_ids)
+        except Exception as exc:
+            APP_LOGGER.warning(
+                msg=f"SKU prefetch via {self._primary.provider_name} failed: {exc}"
+            )
+
+    def invalidate_prices(self) -> None:
+        self._primary.invalidate_prices()
+        self._fallback.invalidate_prices()
+
     def get_vertex_ai_token_price(
         self, model_id: str, token_type: str
     ) -> float | None:
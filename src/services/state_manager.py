@@ -19,6 +19,8 @@ from __future__ import annotations
 import json
 import os
 import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from typing import Any
 
@@ -36,6 +38,8 @@ class StateManager:
       used as the baseline value during reset.
     * **Alert tracking** – which alert levels (WARNING / CRITICAL) have
       been sent per service, persisted to survive container restarts.
+    * **Disabled services** – services whose API the guard disabled this
+      month, so check cycles can skip re-querying them.
     * **Action history** – audit log of resets / disables.
     """
 
@@ -52,6 +56,10 @@ class StateManager:
         )
 
         self._lock = threading.Lock()
+        # Per-thread batch() bookkeeping: ``depth`` open scopes and a
+        # ``dirty`` flag.  Only the batching thread's own saves are
+        # deferred; writes from other threads persist immediately.
+        self._batch = threading.local()
 
         # ── Determine storage backend ─────────────────────────────────
         self._bucket_name: str = bucket_name or BUDGET_STATE_BUCKET
@@ -106,8 +114,12 @@ class StateManager:
 
     def set_last_known_cost(self, service_key: str, cost: float) -> None:
         """Save the cumulative cost from the latest check cycle."""
+        cost = round(cost, 6)
         with self._lock:
-            self._state.setdefault("last_known_costs", {})[service_key] = round(cost, 6)
+            costs = self._state.setdefault("last_known_costs", {})
+            if costs.get(service_key) == cost:
+                return
+            costs[service_key] = cost
             self._save()
 
     # ── Alert Tracking ────────────────────────────────────────────────────
@@ -136,6 +148,25 @@ class StateManager:
             self._save()
         APP_LOGGER.info(msg=f"Alert tracking cleared for {service_key}")
 
+    # ── Enforced Services ─────────────────────────────────────────────────
+
+    def get_disabled_services(self) -> list[str]:
+        """Return service keys this guard disabled during the current month."""
+        with self._lock:
+            return list(self._state.get("disabled_services", []))
+
+    def set_service_disabled(self, service_key: str, disabled: bool) -> None:
+        """Record (or clear) that the guard disabled a service's API."""
+        with self._lock:
+            services = self._state.setdefault("disabled_services", [])
+            if disabled == (service_key in services):
+                return
+            if disabled:
+                services.append(service_key)
+            else:
+                services.remove(service_key)
+            self._save()
+
     # ── Action History ────────────────────────────────────────────────────
 
     def record_action(self, action: str, details: dict[str, Any]) -> None:
@@ -185,10 +216,33 @@ class StateManager:
             self._state["baselines"] = {}
             self._state["alerts_sent"] = {}
             self._state["last_known_costs"] = {}
+            self._state["disabled_services"] = []
             self._state["current_month"] = current_month
             self._save()
             return True
 
+    # ── Write batching ────────────────────────────────────────────────────
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Coalesce every write this thread makes inside the block into one save.
+
+        Mutations still apply to the in-memory state immediately; only
+        the persistence round-trip is deferred to the end of the
+        outermost ``batch()`` block.  Writes from other threads (e.g. a
+        concurrent ``/reset``) are not deferred.
+        """
+        batch = self._batch
+        batch.depth = getattr(batch, "depth", 0) + 1
+        try:
+            yield
+        finally:
+            batch.depth -= 1
+            if batch.depth == 0 and getattr(batch, "dirty", False):
+                batch.dirty = False
+                with self._lock:
+                    self._save()
+
     # ── Serialisation ─────────────────────────────────────────────────────
 
     def as_dict(self) -> dict[str, Any]:
@@ -215,6 +269,9 @@ class StateManager:
 
     def _save(self) -> None:
         """Persist state to the configured backend.  Fails silently (logged)."""
+        if getattr(self._batch, "depth", 0):
+            self._batch.dirty = True
+            return
         if self._use_gcs:
             self._save_to_gcs()
         else:
@@ -8,20 +8,51 @@ IMPORTANT DESIGN DECISION
 • `disable_dependent_services` is always False to prevent cascading outages.
 """
 
+import threading
 import time
 
+import google.auth
+import google_auth_httplib2
+import httplib2
 from googleapiclient import discovery
 from googleapiclient.errors import HttpError
+from googleapiclient.http import HttpRequest
 
 from helpers.constants import APP_LOGGER, DRY_RUN_MODE
 
+_SCOPES = ("https://www.googleapis.com/auth/cloud-platform",)
+
+# httplib2.Http is not thread-safe and breached services are disabled
+# concurrently, so every thread gets its own authorised connection.
+# Credentials are resolved once and shared.
+_credentials = None
+_credentials_lock = threading.Lock()
+_thread_local = threading.local()
+
+
+def _thread_http() -> google_auth_httplib2.AuthorizedHttp:
+    global _credentials
+    http = getattr(_thread_local, "http", None)
+    if http is None:
+        with _credentials_lock:
+            if _credentials is None:
+                _credentials, _ = google.auth.default(scopes=_SCOPES)
+        http = google_auth_httplib2.AuthorizedHttp(_credentials, http=httplib2.Http())
+        _thread_local.http = http
+    return http
+
+
+def _build_request(http, *args, **kwargs) -> HttpRequest:
+    """``requestBuilder`` hook: send each request on the calling thread's connection."""
+    return HttpRequest(_thread_http(), *args, **kwargs)
+
 
 class WrapperCloudAPIs:
     """Enable / disable individual GCP service APIs."""
 
     def __init__(self, project_id: str) -> None:
         self.service_usage_client = discovery.build(
-            serviceName="serviceusage", version="v1"
+            serviceName="serviceusage", version="v1", requestBuilder=_build_request
         )
         self.project_id = project_id
         APP_LOGGER.info(msg=f"Cloud APIs wrapper initialised for project {project_id}")
@@ -4,21 +4,53 @@ Replaces the previous hardcoded price dictionaries with real-time
 lookups from the Cloud Billing Catalog (CloudCatalogClient).
 """
 
+import logging
+import threading
+import time
+from collections.abc import Iterable
 from typing import Any
 
 from google.cloud.billing_v1 import CloudCatalogClient
 from google.cloud.billing_v1.types import Sku
 
-from helpers.constants import APP_LOGGER, CURRENCY_CODE
+from helpers.constants import APP_LOGGER, CURRENCY_CODE, PRICE_CACHE_TTL_HOURS
+
+
+# SKU prices change at most daily: a service's SKU list is re-fetched after
+# PRICE_CACHE_TTL_HOURS.  A failed listing is retried sooner so a transient
+# outage does not pin the service to "no prices" for hours.
+_SKU_TTL_SECONDS = PRICE_CACHE_TTL_HOURS * 3600
+_FAILED_LOAD_TTL_SECONDS = min(15 * 60, _SKU_TTL_SECONDS)
+
+# Process-wide client shared by every wrapper instance so that credential
+# discovery and gRPC channel setup happen once per process.
+_client: CloudCatalogClient | None = None
+# Check-cycle pool threads may make the first call concurrently
+_client_lock = threading.Lock()
+
+
+def _get_client() -> CloudCatalogClient:
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = CloudCatalogClient()
+    return _client
 
 
 class CloudBillingWrapper:
     """Fetch SKU prices from the Cloud Billing Catalog API."""
 
     def __init__(self) -> None:
-        self.client = CloudCatalogClient()
+        self.client = _get_client()
         # Cache: service_id → {sku_id → Sku}
         self._sku_cache: dict[str, dict[str, Sku]] = {}
+        # service_id → time.monotonic() deadline of its cached SKU list
+        self._sku_expiry: dict[str, float] = {}
+        # (service_id, sku_id, price_tier) → extracted price per base unit
+        self._price_cache: dict[tuple[str, str, int], float | None] = {}
+        # Check cycles look prices up from several threads at once
+        self._lock = threading.Lock()
         APP_LOGGER.info(msg="Cloud Billing wrapper initialised (SKU pricing).")
 
     # ── public ────────────────────────────────────────────────────────────
@@ -36,20 +68,49 @@ class CloudBillingWrapper:
         to the smallest unit so that it can be multiplied directly by the
         raw metric value from Cloud Monitoring.
         """
-        APP_LOGGER.debug(
-            msg=f"Looking up price for service={service_id} sku={sku_id} tier={price_tier}"
-        )
+        if APP_LOGGER.isEnabledFor(logging.DEBUG):
+            APP_LOGGER.debug(
+                msg=f"Looking up price for service={service_id} sku={sku_id} tier={price_tier}"
+            )
         self._ensure_skus_loaded(service_id)
-        return self._extract_price(service_id, sku_id, price_tier)
+        key = (service_id, sku_id, price_tier)
+        # Under the lock so a concurrent SKU refresh can neither mutate the
+        # cache mid-lookup nor have a price from its old list written back
+        with self._lock:
+            try:
+                return self._price_cache[key]
+            except KeyError:
+                price = self._extract_price(service_id, sku_id, price_tier)
+                self._price_cache[key] = price
+                return price
+
+    def invalidate(self) -> None:
+        """Drop every cached SKU list and price; the next lookup re-fetches."""
+        with self._lock:
+            self._sku_cache.clear()
+            self._sku_expiry.clear()
+            self._price_cache.clear()
+
+    def prefetch(self, service_ids: Iterable[str]) -> None:
+        """Load the SKU lists of several services up front.
+
+        Each service is listed at most once per wrapper, so later price
+        lookups for any of its SKUs are served from the local cache.
+        """
+        for service_id in service_ids:
+            self._ensure_skus_loaded(service_id)
 
     # ── internals ─────────────────────────────────────────────────────────
 
     def _ensure_skus_loaded(self, service_id: str) -> None:
-        """Load all SKUs for a service into the local cache (once)."""
-        if service_id in self._sku_cache:
+        """Load all SKUs for a service into the local cache (once per TTL)."""
+        if time.monotonic() < self._sku_expiry.get(service_id, 0.0):
             return
 
-        self._sku_cache[service_id] = {}
+        # List without the lock so a slow listing does not block cached
+        # price lookups for other services
+        skus: dict[str, Sku] = {}
+        ttl = _SKU_TTL_SECONDS
         try:
             for sku in self.client.list_skus(
                 request={
@@ -57,9 +118,21 @@ class CloudBillingWrapper:
                     "currency_code": CURRENCY_CODE,
                 }
             ):
-                self._sku_cache[service_id][sku.sku_id] = sku
+                skus[sku.sku_id] = sku
         except Exception as exc:
             APP_LOGGER.error(msg=f"Error loading SKUs for service {service_id}: {exc}")
+            ttl = _FAILED_LOAD_TTL_SECONDS
+
+        with self._lock:
+            # Another thread may have stored a fresh list meanwhile
+            now = time.monotonic()
+            if now < self._sku_expiry.get(service_id, 0.0):
+                return
+
+            self._sku_cache[service_id] = skus
+            for key in [k for k in self._price_cache if k[0] == service_id]:
+                del self._price_cache[key]
+            self._sku_expiry[service_id] = now + ttl
 
     def _extract_price(
         self, service_id: str, sku_id: str, price_tier: int
@@ -90,11 +163,12 @@ class CloudBillingWrapper:
         conversion_factor = pricing_expression.base_unit_conversion_factor or 1
         price_per_base_unit = price_per_usage_unit / conversion_factor
 
-        APP_LOGGER.debug(
-            msg=(
-                f"SKU {sku_id}: {price_per_usage_unit} {CURRENCY_CODE} per "
-                f"{pricing_expression.usage_unit_description} → "
-                f"{price_per_base_unit} per {pricing_expression.base_unit_description}"
+        if APP_LOGGER.isEnabledFor(logging.DEBUG):
+            APP_LOGGER.debug(
+                msg=(
+                    f"SKU {sku_id}: {price_per_usage_unit} {CURRENCY_CODE} per "
+                    f"{pricing_expression.usage_unit_description} → "
+                    f"{price_per_base_unit} per {pricing_expression.base_unit_description}"
+                )
             )
-        )
         return price_per_base_unit
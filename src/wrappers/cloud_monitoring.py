@@ -6,9 +6,17 @@ so that cost estimates match the monthly billing cycle.
 
 from __future__ import annotations
 
+import logging
+import math
+import re
+import threading
+import time
+from collections.abc import Sequence
 from datetime import timedelta
+from functools import lru_cache
 from typing import Any
 
+from google.api_core.exceptions import ResourceExhausted, ServiceUnavailable
 from google.cloud import monitoring_v3
 from google.cloud.monitoring_v3.services.metric_service.pagers import (
     ListTimeSeriesPager,
@@ -17,19 +25,74 @@ from google.cloud.monitoring_v3.services.metric_service.pagers import (
 from helpers import utils
 from helpers.constants import APP_LOGGER, PROJECT_ID
 
+# Shortest alignment period Cloud Monitoring accepts
+_MIN_ALIGNMENT_SECONDS = 60
+
+# After a quota or availability error every query fails fast for this
+# long, instead of each remaining metric sitting through its own retries.
+_BREAKER_COOLDOWN_SECONDS = 60.0
+
+# Process-wide client shared by every wrapper instance so that credential
+# discovery and gRPC channel setup happen once per process.
+_client: monitoring_v3.MetricServiceClient | None = None
+# Check-cycle pool threads may make the first call concurrently
+_client_lock = threading.Lock()
+
+
+def _get_client() -> monitoring_v3.MetricServiceClient:
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = monitoring_v3.MetricServiceClient()
+    return _client
+
+
+@lru_cache(maxsize=None)
+def _build_filter(metric_name: str, metric_filter: str | None) -> str:
+    """Server-side ``list_time_series`` filter for one metric.
+
+    The registry is static, so each (metric, extra filter) pair is
+    assembled once per process and reused on every check cycle.
+    """
+    if metric_filter:
+        return f'metric.type = "{metric_name}" AND {metric_filter}'
+    return f'metric.type = "{metric_name}"'
+
+
+# "resource.label.<key>" / "metric.label.<key>" group-by field names
+_LABEL_FIELD_RE = re.compile(r"(resource|metric)\.label\.(\w+)")
+
+
+@lru_cache(maxsize=None)
+def _parse_group_by(group_by_fields: tuple[str, ...]) -> tuple[tuple[str, bool], ...]:
+    """Resolve group-by fields to ``(label_key, is_resource_label)`` pairs.
+
+    Parsed once per distinct field list instead of once per returned
+    time series; fields that are not resource/metric labels are skipped.
+    """
+    specs = []
+    for field in group_by_fields:
+        match = _LABEL_FIELD_RE.fullmatch(field)
+        if match:
+            specs.append((match.group(2), match.group(1) == "resource"))
+    return tuple(specs)
+
 
 class WrapperCloudMonitoring:
     """Query Cloud Monitoring time-series data."""
 
     def __init__(self) -> None:
-        self.client = monitoring_v3.MetricServiceClient()
+        self.client = _get_client()
+        # time.monotonic() until which queries are skipped (circuit open)
+        self._breaker_open_until = 0.0
         APP_LOGGER.info(msg="Cloud Monitoring wrapper initialised.")
 
     def get_total_units(
         self,
         metric_name: str,
         metric_filter: str | None = None,
-        group_by_fields: list[str] | None = None,
+        group_by_fields: Sequence[str] | None = None,
     ) -> int:
         """Return the aggregate count of units for a metric this month."""
         ts_pager = self._query_time_series(metric_name, metric_filter, group_by_fields)
@@ -40,14 +103,15 @@ class WrapperCloudMonitoring:
         for ts in ts_pager:
             for point in ts.points:
                 total += point.value.int64_value
-        APP_LOGGER.debug(msg=f"Metric {metric_name}: total units = {total}")
+        if APP_LOGGER.isEnabledFor(logging.DEBUG):
+            APP_LOGGER.debug(msg=f"Metric {metric_name}: total units = {total}")
         return total
 
     def get_grouped_units(
         self,
         metric_name: str,
         metric_filter: str | None = None,
-        group_by_fields: list[str] | None = None,
+        group_by_fields: Sequence[str] | None = None,
     ) -> list[dict[str, Any]]:
         """Return per-group unit counts for a metric this month.
 
@@ -64,33 +128,29 @@ class WrapperCloudMonitoring:
         if ts_pager is None:
             return []
 
+        label_specs = _parse_group_by(tuple(group_by_fields or ()))
+
         results: list[dict[str, Any]] = []
         for ts in ts_pager:
             units = sum(point.value.int64_value for point in ts.points)
 
             # Flatten resource + metric labels into a single dict, keeping
             # only the leaf key name (last segment of the group-by field).
-            labels: dict[str, str] = {}
-            for field in (group_by_fields or []):
-                key = field.rsplit(".", 1)[-1]  # e.g. "model_user_id"
-                if field.startswith("resource.label."):
-                    labels[key] = (
-                        ts.resource.labels.get(key, "")
-                        if ts.resource and ts.resource.labels
-                        else ""
-                    )
-                elif field.startswith("metric.label."):
-                    labels[key] = (
-                        ts.metric.labels.get(key, "")
-                        if ts.metric and ts.metric.labels
-                        else ""
-                    )
+            resource_labels = (
+                ts.resource.labels if ts.resource and ts.resource.labels else {}
+            )
+            metric_labels = ts.metric.labels if ts.metric and ts.metric.labels else {}
+            labels = {
+                key: (resource_labels if is_resource else metric_labels).get(key, "")
+                for key, is_resource in label_specs
+            }
 
             results.append({"labels": labels, "units": units})
 
-        APP_LOGGER.debug(
-            msg=f"Grouped query {metric_name}: {len(results)} group(s)"
-        )
+        if APP_LOGGER.isEnabledFor(logging.DEBUG):
+            APP_LOGGER.debug(
+                msg=f"Grouped query {metric_name}: {len(results)} group(s)"
+            )
         return results
 
     # ── internal ──────────────────────────────────────────────────────────
@@ -99,26 +159,49 @@ class WrapperCloudMonitoring:
         self,
         metric_name: str,
         metric_filter: str | None,
-        group_by_fields: list[str] | None,
+        group_by_fields: Sequence[str] | None,
     ) -> ListTimeSeriesPager | None:
-        """Build and execute a Cloud Monitoring list_time_series request."""
-        interval = monitoring_v3.TimeInterval(
-            start_time=utils.first_day_of_current_month_utc(),
-            end_time=utils.now_utc(),
-        )
+        """Build and execute a Cloud Monitoring list_time_series request.
 
+        Quota and availability errors are re-raised (and, while the circuit
+        is open, raised without an RPC) so callers report the metric as
+        failed instead of treating it as zero usage.
+        """
+        if time.monotonic() < self._breaker_open_until:
+            APP_LOGGER.warning(
+                msg=f"Skipping metric {metric_name}: Monitoring API unavailable (circuit open)"
+            )
+            raise ServiceUnavailable(
+                f"Monitoring queries paused (circuit open); skipped {metric_name}"
+            )
+
+        start = utils.first_day_of_current_month_utc()
+        end = utils.now_utc()
+        interval = monitoring_v3.TimeInterval(start_time=start, end_time=end)
+
+        # One alignment period spanning the whole month-to-date window: the
+        # server sums each series down to a single point instead of one
+        # per day, so responses stay small and the client-side sums trivial.
+        window = math.ceil((end - start).total_seconds())
+        if window < _MIN_ALIGNMENT_SECONDS:
+            # A window shorter than the minimum alignment period would reach
+            # back into last month; the month's first minute counts as 0.
+            if APP_LOGGER.isEnabledFor(logging.DEBUG):
+                APP_LOGGER.debug(
+                    msg=f"Skipping metric {metric_name}: month started {window}s ago"
+                )
+            return None
         aggregation = monitoring_v3.Aggregation(
-            alignment_period=timedelta(days=1),
+            alignment_period=timedelta(seconds=window),
             per_series_aligner=monitoring_v3.Aggregation.Aligner.ALIGN_SUM,
             cross_series_reducer=monitoring_v3.Aggregation.Reducer.REDUCE_SUM,
             group_by_fields=group_by_fields or [],
         )
 
-        full_filter = f'metric.type = "{metric_name}"'
-        if metric_filter:
-            full_filter += f" AND {metric_filter}"
+        full_filter = _build_filter(metric_name, metric_filter)
 
-        APP_LOGGER.debug(msg=f"Monitoring query: filter={full_filter}")
+        if APP_LOGGER.isEnabledFor(logging.DEBUG):
+            APP_LOGGER.debug(msg=f"Monitoring query: filter={full_filter}")
 
         try:
             pager = self.client.list_time_series(
@@ -131,6 +214,15 @@ class WrapperCloudMonitoring:
                 }
             )
             return pager if pager else None
+        except (ResourceExhausted, ServiceUnavailable) as exc:
+            self._breaker_open_until = time.monotonic() + _BREAKER_COOLDOWN_SECONDS
+            APP_LOGGER.error(
+                msg=(
+                    f"Error querying metric {metric_name}: {exc} – "
+                    f"pausing Monitoring queries for {_BREAKER_COOLDOWN_SECONDS:.0f}s"
+                )
+            )
+            raise
         except Exception as exc:
             APP_LOGGER.error(msg=f"Error querying metric {metric_name}: {exc}")
             return None
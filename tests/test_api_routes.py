@@ -21,6 +21,7 @@ def client():
         "budget": {},
         "disabled_apis": [],
         "warnings_sent": [],
+        "critical_sent": [],
         "metric_details": [],
     }
     mock_monitor.enable_service.return_value = True
@@ -95,10 +96,15 @@ class TestResetEndpoint:
         data = resp.json()
         assert "baseline_saved" in data
 
+    def test_reset_key_is_case_insensitive(self, client):
+        resp = client.post("/reset/Firestore")
+        assert resp.status_code == 200
+
     def test_reset_invalid_key(self, client):
         resp = client.post("/reset/nonexistent")
         assert resp.status_code == 400
         assert "Unknown service key" in resp.json()["message"]
+        assert "Valid keys: ['vertex_ai', 'bigquery', 'firestore']" in resp.json()["message"]
 
 
 class TestStatusEndpoints:
@@ -112,6 +118,22 @@ class TestStatusEndpoints:
         assert resp.status_code == 200
         assert resp.json()["service_key"] == "firestore"
 
+    def test_single_status_case_insensitive(self, client):
+        resp = client.get("/status/FIRESTORE")
+        assert resp.status_code == 200
+        assert resp.json()["service_key"] == "firestore"
+
     def test_single_status_invalid(self, client):
         resp = client.get("/status/nonexistent")
         assert resp.status_code == 400
+
+
+def test_shutdown_flushes_alerts_before_stopping_logger():
+    from fastapi_app import app as app_module
+
+    calls: list[str] = []
+    with patch.object(app_module, "flush_notifications", side_effect=lambda: calls.append("flush")), \
+            patch.object(app_module.APP_LOGGER, "stop", side_effect=lambda: calls.append("stop")):
+        with TestClient(app_module.app):
+            pass
+    assert calls == ["flush", "stop"]
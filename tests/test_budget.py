@@ -64,6 +64,16 @@ class TestProjectBudget:
         pb.services["firestore"].current_expense = 30.0
         assert pb.total_expense == pytest.approx(60.0)
 
+    def test_total_expense_tracks_updates(self):
+        pb = ProjectBudget()
+        assert pb.total_expense == pytest.approx(0.0)
+        pb.services["bigquery"].current_expense += 5.0
+        assert pb.total_expense == pytest.approx(5.0)
+        pb.services["bigquery"].current_expense = 2.0
+        assert pb.total_expense == pytest.approx(2.0)
+        pb.services["extra"] = ServiceBudget("extra", "extra.googleapis.com", 10.0, 3.0)
+        assert pb.total_expense == pytest.approx(5.0)
+
     def test_get_exceeded_services(self):
         pb = ProjectBudget()
         pb.services["vertex_ai"].current_expense = 200.0  # exceeds 100 budget
@@ -1,8 +1,15 @@
 """Integration-style tests for the BudgetMonitorService."""
 
+import threading
+import time
 from unittest.mock import MagicMock, patch
 
+from config.monitored_services import MonitoredMetric
+from config.monitored_services_list import SERVICE_METRICS
+from helpers.constants import MONITORED_API_SERVICES
 from services.budget_monitor import BudgetMonitorService
+from services.price_provider import PriceProvider
+from wrappers.cloud_monitoring import WrapperCloudMonitoring
 
 
 class TestBudgetMonitorService:
@@ -29,6 +36,10 @@ class TestBudgetMonitorService:
 
             mock_provider_factory.return_value = mock_provider
             mock_provider.provider_name = "mock_provider"
+            # Bulk lookups resolve through the mocked per-key lookup
+            mock_provider.get_prices_bulk.side_effect = (
+                lambda keys: PriceProvider.get_prices_bulk(mock_provider, keys)
+            )
             mock_mon_cls.return_value = mock_mon
             mock_apis_cls.return_value = mock_apis
             mock_notif_cls.return_value = mock_notif
@@ -81,6 +92,72 @@ class TestBudgetMonitorService:
         # At least one API should be in the disabled list
         assert len(result["disabled_apis"]) > 0
 
+    @patch("services.budget_monitor.DRY_RUN_MODE", False)
+    def test_every_exceeded_service_disabled_in_service_order(self):
+        """Concurrent enforcement still reports disables in registry order."""
+        svc = self._make_service()
+        svc.price_provider.get_price_per_unit.return_value = 1000.0
+        svc.monitoring.get_total_units.return_value = 1
+        svc.apis.disable_api.return_value = True
+
+        result = svc.run_check()
+
+        expected = [
+            api for key, api in MONITORED_API_SERVICES.items() if key in SERVICE_METRICS
+        ]
+        assert result["disabled_apis"] == expected
+        assert svc.notifications.send_critical_alert.call_count == len(expected)
+        svc.notifications.send_warning_alert.assert_not_called()
+
+    @patch("services.budget_monitor.DRY_RUN_MODE", False)
+    def test_summary_lists_only_delivered_alerts(self):
+        """Alerts are reported after flush(), and only if actually delivered."""
+        svc = self._make_service()
+        svc.price_provider.get_price_per_unit.return_value = 1000.0
+        svc.monitoring.get_total_units.return_value = 1
+        svc.apis.disable_api.return_value = True
+        svc.notifications.send_critical_alert.return_value = True
+        # Delivery succeeded for vertex_ai only
+        svc.notifications.is_alert_sent.side_effect = (
+            lambda key, level: key == "vertex_ai" and level == "CRITICAL"
+        )
+
+        result = svc.run_check()
+
+        svc.notifications.flush.assert_called_once()
+        assert result["critical_sent"] == ["vertex_ai"]
+        assert result["warnings_sent"] == []
+
+    def test_disabled_service_skips_queries(self):
+        """A service still disabled from earlier this month is not re-queried."""
+        svc = self._make_service()
+        svc.price_provider.get_price_per_unit.return_value = 0.0
+        svc.monitoring.get_total_units.return_value = 0
+        svc.state.get_disabled_services.return_value = ["firestore"]
+        svc.state.get_last_known_cost.return_value = 123.0
+        svc.apis.get_api_status.return_value = "DISABLED"
+
+        result = svc.run_check()
+
+        queried = {c.kwargs["metric_name"] for c in svc.monitoring.get_total_units.call_args_list}
+        assert not queried & {m.metric_name for m in SERVICE_METRICS["firestore"]}
+        assert result["already_disabled"] == ["firestore"]
+        assert result["budget"]["services"]["firestore"]["current_expense"] == 123.0
+        svc.apis.disable_api.assert_not_called()
+        svc.notifications.send_critical_alert.assert_not_called()
+
+    def test_service_re_enabled_out_of_band_is_checked(self):
+        svc = self._make_service()
+        svc.price_provider.get_price_per_unit.return_value = 0.0
+        svc.monitoring.get_total_units.return_value = 0
+        svc.state.get_disabled_services.return_value = ["firestore"]
+        svc.apis.get_api_status.return_value = "ENABLED"
+
+        result = svc.run_check()
+
+        assert result["already_disabled"] == []
+        svc.state.set_service_disabled.assert_called_once_with("firestore", False)
+
     def test_enable_service_calls_wrapper(self):
         svc = self._make_service()
         svc.apis.enable_api.return_value = True
@@ -156,6 +233,113 @@ class TestBudgetMonitorService:
         result = svc.run_check()
         assert result["data_warnings"] == []
 
+    def test_plain_metrics_fetched_once_each(self):
+        """Concurrent prefetch should price and measure each metric exactly once."""
+        svc = self._make_service()
+        svc.price_provider.get_price_per_unit.return_value = 0.0
+        svc.monitoring.get_total_units.return_value = 1
+
+        svc.run_check()
+
+        plain = [
+            m for ms in SERVICE_METRICS.values() for m in ms if not m.is_catch_all
+        ]
+        assert svc.price_provider.get_price_per_unit.call_count == len(plain)
+        assert svc.monitoring.get_total_units.call_count == len(plain)
+
+    def test_zero_usage_metrics_not_priced(self):
+        """No SKU lookups are made for metrics that report zero units."""
+        svc = self._make_service()
+        svc.price_provider.get_price_per_unit.return_value = None
+        svc.monitoring.get_total_units.return_value = 0
+
+        result = svc.run_check()
+
+        svc.price_provider.get_price_per_unit.assert_not_called()
+        assert result["data_warnings"] == []
+        assert result["budget"]["total_expense"] == 0.0
+        plain = [d for d in result["metric_details"] if "price_per_unit" in d]
+        assert plain and all(d["price_per_unit"] is None for d in plain)
+
+    def test_failed_usage_query_still_priced(self):
+        """Pricing and monitoring both failing is reported as such."""
+        svc = self._make_service()
+        svc.price_provider.get_price_per_unit.return_value = None
+        svc.monitoring.get_total_units.side_effect = Exception("monitoring down")
+
+        result = svc.run_check()
+
+        svc.price_provider.get_price_per_unit.assert_called()
+        assert any(
+            "Both pricing and monitoring unavailable" in w
+            for w in result["data_warnings"]
+        )
+
+    def test_catch_all_runs_alongside_plain_prefetch(self):
+        """Catch-all grouped queries overlap the plain-metric fetches."""
+        svc = self._make_service()
+        svc.price_provider.get_price_per_unit.return_value = 0.0
+        plain_started = threading.Event()
+        overlapped: list[bool] = []
+
+        def total_units(**kwargs):
+            plain_started.set()
+            return 0
+
+        def grouped_units(**kwargs):
+            overlapped.append(plain_started.wait(timeout=5))
+            return []
+
+        svc.monitoring.get_total_units.side_effect = total_units
+        svc.monitoring.get_grouped_units.side_effect = grouped_units
+
+        svc.run_check()
+
+        assert overlapped and all(overlapped)
+
+    def test_shared_sku_priced_once(self):
+        """Metrics sharing a SKU trigger a single price lookup per cycle."""
+        svc = self._make_service()
+        svc.price_provider.get_price_per_unit.return_value = 0.5
+        svc.monitoring.get_total_units.return_value = 2
+        first = MonitoredMetric(
+            label="a", metric_name="m.a",
+            billing_service_id="SVC", billing_sku_id="SKU",
+        )
+        second = MonitoredMetric(
+            label="b", metric_name="m.b",
+            billing_service_id="SVC", billing_sku_id="SKU",
+        )
+
+        fetched = svc._prefetch_metrics([first, second])
+
+        svc.price_provider.get_price_per_unit.assert_called_once()
+        assert svc.monitoring.get_total_units.call_count == 2
+        assert fetched[id(first)] == fetched[id(second)] == ((0.5, False), (2, False))
+
+    def test_prices_fetched_in_one_bulk_call(self):
+        """A check cycle prices all used SKUs through a single bulk call."""
+        svc = self._make_service()
+        svc.price_provider.get_price_per_unit.return_value = 0.0
+        svc.monitoring.get_total_units.return_value = 1
+
+        svc.run_check()
+
+        svc.price_provider.get_prices_bulk.assert_called_once()
+
+    def test_bulk_pricing_failure_marks_all_skus_failed(self):
+        svc = self._make_service()
+        svc.price_provider.get_prices_bulk.side_effect = Exception("billing down")
+        svc.monitoring.get_total_units.return_value = 3
+        metric = MonitoredMetric(
+            label="a", metric_name="m.a",
+            billing_service_id="SVC", billing_sku_id="SKU",
+        )
+
+        fetched = svc._prefetch_metrics([metric])
+
+        assert fetched[id(metric)] == ((None, True), (3, False))
+
     def test_baseline_subtracted_from_cost(self):
         """After reset, effective cost = raw_cost - baseline."""
         svc = self._make_service()
@@ -186,6 +370,61 @@ class TestBudgetMonitorService:
         svc.state.set_baseline.assert_called_once_with("vertex_ai", 150.0)
         svc.notifications.reset_alerts.assert_called_once_with("vertex_ai")
 
+    def test_reset_service_reuses_recent_check_cost(self):
+        """A reset right after a check cycle skips the live cost query."""
+        svc = self._make_service()
+        svc.price_provider.get_price_per_unit.return_value = 0.5
+        svc.monitoring.get_total_units.return_value = 2
+        svc.run_check()
+        svc._get_current_cumulative_cost = MagicMock(return_value=999.0)
+        svc.apis.enable_api.return_value = True
+
+        result = svc.reset_service("firestore")
+
+        svc._get_current_cumulative_cost.assert_not_called()
+        plain = [m for m in SERVICE_METRICS["firestore"] if not m.is_catch_all]
+        assert result["baseline_saved"] == round(len(plain) * 1.0, 4)
+
+    def test_reset_service_ignores_stale_check_cost(self):
+        svc = self._make_service()
+        svc._cost_snapshot["firestore"] = (0.0, 10.0)
+        svc._get_current_cumulative_cost = MagicMock(return_value=42.0)
+        svc.apis.enable_api.return_value = True
+
+        with patch("services.budget_monitor.time.monotonic", return_value=1000.0):
+            result = svc.reset_service("firestore")
+
+        assert result["baseline_saved"] == 42.0
+
+    def test_reset_service_falls_back_when_monitoring_circuit_open(self):
+        """An open Monitoring circuit must not produce an understated baseline."""
+        svc = self._make_service()
+        with patch("wrappers.cloud_monitoring._get_client", return_value=MagicMock()):
+            svc.monitoring = WrapperCloudMonitoring()
+        svc.monitoring._breaker_open_until = float("inf")
+        svc.price_provider.get_price_per_unit.return_value = 0.5
+        svc.state.get_last_known_cost.return_value = 123.0
+        svc.apis.enable_api.return_value = True
+
+        assert svc._get_current_cumulative_cost("firestore") is None
+        result = svc.reset_service("firestore")
+
+        assert result["baseline_saved"] == 123.0
+        svc.monitoring.client.list_time_series.assert_not_called()
+
+    def test_reset_after_month_rollover_ignores_last_months_check_cost(self):
+        """A check at 23:59 must not seed a reset made just after midnight."""
+        svc = self._make_service()
+        svc._cost_snapshot["firestore"] = (time.monotonic(), 10.0)
+        svc.state.check_month_rollover.return_value = True
+        svc._get_current_cumulative_cost = MagicMock(return_value=0.25)
+        svc.apis.enable_api.return_value = True
+
+        result = svc.reset_service("firestore")
+
+        assert result["baseline_saved"] == 0.25
+        assert svc._cost_snapshot == {}
+
     def test_reset_service_enables_api(self):
         """reset_service should call enable_api for the service."""
         svc = self._make_service()
@@ -376,8 +615,7 @@ class TestBudgetMonitorService:
     def test_month_rollover_re_enables_services(self):
         """On month rollover, all monitored services should be re-enabled."""
         svc = self._make_service()
-        svc._pending_rollover = True
-        svc.state.check_month_rollover.return_value = False  # already consumed
+        svc.state.check_month_rollover.return_value = True
         svc.apis.enable_api.return_value = True
         svc.price_provider.get_price_per_unit.return_value = 0.0
         svc.monitoring.get_total_units.return_value = 0
@@ -387,10 +625,19 @@ class TestBudgetMonitorService:
         # All three services should have been re-enabled
         assert svc.apis.enable_api.call_count == 3
 
+    def test_month_rollover_skips_already_enabled_services(self):
+        svc = self._make_service()
+        svc.apis.get_api_status.side_effect = lambda api_name: (
+            "DISABLED" if api_name == "bigquery.googleapis.com" else "ENABLED"
+        )
+        svc.apis.enable_api.return_value = True
+
+        assert svc._re_enable_all_services() == ["bigquery.googleapis.com"]
+        svc.apis.enable_api.assert_called_once_with(api_name="bigquery.googleapis.com")
+
     def test_no_re_enable_without_rollover(self):
         """Services should NOT be re-enabled during normal check cycles."""
         svc = self._make_service()
-        svc._pending_rollover = False
         svc.state.check_month_rollover.return_value = False
         svc.price_provider.get_price_per_unit.return_value = 0.0
         svc.monitoring.get_total_units.return_value = 0
@@ -1,9 +1,11 @@
 """Unit tests for wrappers.cloud_apis (disable / enable / status)."""
 
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from wrappers import cloud_apis
 from wrappers.cloud_apis import WrapperCloudAPIs
 
 
@@ -62,3 +64,22 @@ class TestWrapperCloudAPIs:
 
         state = wrapper.get_api_status("firestore.googleapis.com")
         assert state is None
+
+    def test_each_thread_gets_its_own_http(self):
+        """Concurrent disables must not share one httplib2 connection."""
+        with (
+            patch.object(cloud_apis, "_credentials", None),
+            patch.object(cloud_apis, "_thread_local", threading.local()),
+            patch("wrappers.cloud_apis.google.auth.default") as mock_default,
+        ):
+            mock_default.return_value = (MagicMock(), "test-project")
+            main_http = cloud_apis._thread_http()
+            assert cloud_apis._thread_http() is main_http
+
+            other: list = []
+            worker = threading.Thread(target=lambda: other.append(cloud_apis._thread_http()))
+            worker.start()
+            worker.join()
+
+            assert other[0] is not main_http
+            mock_default.assert_called_once()
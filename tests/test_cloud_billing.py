@@ -33,6 +33,85 @@ class TestCloudBillingWrapper:
         assert wrapper.client.list_skus.call_count == 1
         assert "TEST-SKU-1" in wrapper._sku_cache["SVC-1"]
 
+    def test_prefetch_loads_each_service_once(self):
+        """prefetch should list SKUs for every service exactly once."""
+        wrapper = self._make_wrapper()
+        wrapper.client.list_skus.return_value = []
+
+        wrapper.prefetch(["SVC-1", "SVC-2"])
+        wrapper.get_sku_price_per_unit("SVC-1", "ANY")
+
+        assert wrapper.client.list_skus.call_count == 2
+        assert set(wrapper._sku_cache) == {"SVC-1", "SVC-2"}
+
+    def test_sku_cache_expires_and_prices_memoised(self):
+        """Prices are extracted once per SKU; the SKU list is re-fetched after its TTL."""
+        wrapper = self._make_wrapper()
+        wrapper.client.list_skus.return_value = []
+
+        with patch.object(wrapper, "_extract_price", return_value=0.5) as extract:
+            assert wrapper.get_sku_price_per_unit("SVC-1", "SKU-1") == 0.5
+            assert wrapper.get_sku_price_per_unit("SVC-1", "SKU-1") == 0.5
+            assert extract.call_count == 1
+
+            wrapper._sku_expiry["SVC-1"] = 0.0
+            wrapper.get_sku_price_per_unit("SVC-1", "SKU-1")
+            assert wrapper.client.list_skus.call_count == 2
+            assert extract.call_count == 2
+
+    def test_price_cache_filled_under_lock(self):
+        """Price extraction and caching cannot interleave with a SKU refresh."""
+        wrapper = self._make_wrapper()
+        wrapper.client.list_skus.return_value = []
+        held: list[bool] = []
+
+        def extract(*args):
+            held.append(wrapper._lock.locked())
+            return 0.5
+
+        with patch.object(wrapper, "_extract_price", side_effect=extract):
+            wrapper.get_sku_price_per_unit("SVC-1", "SKU-1")
+
+        assert held == [True]
+
+    def test_sku_listing_runs_without_lock(self):
+        """A slow listing must not block cached lookups for other services."""
+        wrapper = self._make_wrapper()
+        held: list[bool] = []
+
+        def list_skus(request):
+            held.append(wrapper._lock.locked())
+            return []
+
+        wrapper.client.list_skus.side_effect = list_skus
+        wrapper._ensure_skus_loaded("SVC-1")
+
+        assert held == [False]
+        assert wrapper._sku_cache["SVC-1"] == {}
+
+    def test_failed_sku_load_retried_sooner(self):
+        """A failed listing is cached only for the short failure TTL."""
+        wrapper = self._make_wrapper()
+        wrapper.client.list_skus.side_effect = RuntimeError("boom")
+
+        with patch("wrappers.cloud_billing.time.monotonic", return_value=1000.0):
+            wrapper._ensure_skus_loaded("SVC-1")
+
+        assert wrapper._sku_cache["SVC-1"] == {}
+        assert wrapper._sku_expiry["SVC-1"] == 1000.0 + 15 * 60
+
+    def test_invalidate_clears_caches(self):
+        wrapper = self._make_wrapper()
+        wrapper.client.list_skus.return_value = []
+        wrapper.get_sku_price_per_unit("SVC-1", "SKU-1")
+
+        wrapper.invalidate()
+
+        assert not wrapper._sku_cache
+        assert not wrapper._price_cache
+        wrapper.get_sku_price_per_unit("SVC-1", "SKU-1")
+        assert wrapper.client.list_skus.call_count == 2
+
     def test_extract_price_missing_sku(self):
         """Missing SKU should return None."""
         wrapper = self._make_wrapper()
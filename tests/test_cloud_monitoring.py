@@ -1,8 +1,19 @@
 """Unit tests for wrappers.cloud_monitoring."""
 
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from unittest.mock import MagicMock, patch
 
-from wrappers.cloud_monitoring import WrapperCloudMonitoring
+import pytest
+from google.api_core.exceptions import ResourceExhausted, ServiceUnavailable
+
+from wrappers.cloud_monitoring import (
+    WrapperCloudMonitoring,
+    _build_filter,
+    _get_client,
+    _parse_group_by,
+)
 
 
 class TestWrapperCloudMonitoring:
@@ -14,6 +25,32 @@ class TestWrapperCloudMonitoring:
             wrapper = WrapperCloudMonitoring()
             return wrapper
 
+    def test_client_shared_across_instances(self):
+        with (
+            patch("wrappers.cloud_monitoring._client", None),
+            patch("wrappers.cloud_monitoring.monitoring_v3") as mock_mv3,
+        ):
+            first = WrapperCloudMonitoring()
+            second = WrapperCloudMonitoring()
+            assert first.client is second.client
+            mock_mv3.MetricServiceClient.assert_called_once()
+
+    def test_client_built_once_under_concurrent_first_use(self):
+        def slow_client():
+            time.sleep(0.05)
+            return MagicMock()
+
+        with (
+            patch("wrappers.cloud_monitoring._client", None),
+            patch("wrappers.cloud_monitoring.monitoring_v3") as mock_mv3,
+        ):
+            mock_mv3.MetricServiceClient.side_effect = slow_client
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                clients = list(pool.map(lambda _: _get_client(), range(4)))
+
+        assert mock_mv3.MetricServiceClient.call_count == 1
+        assert all(c is clients[0] for c in clients)
+
     def test_get_total_units_returns_zero_on_no_data(self):
         wrapper = self._make_wrapper()
         # Make the query return None
@@ -99,3 +136,66 @@ class TestWrapperCloudMonitoring:
         models = {r["labels"]["model_user_id"] for r in result}
         assert "gemini-2.5-pro" in models
         assert "claude-3-opus" in models
+
+    def test_build_filter_combines_metric_and_extra_filter(self):
+        assert _build_filter("m", None) == 'metric.type = "m"'
+        assert (
+            _build_filter("m", 'resource.type = "r"')
+            == 'metric.type = "m" AND resource.type = "r"'
+        )
+
+    def test_parse_group_by_skips_non_label_fields(self):
+        assert _parse_group_by(
+            ("resource.label.model_user_id", "metric.label.type", "metric.type")
+        ) == (("model_user_id", True), ("type", False))
+
+    def test_query_aligns_whole_month_into_one_period(self):
+        wrapper = self._make_wrapper()
+        start = datetime(2026, 3, 1, tzinfo=timezone.utc)
+        end = start + timedelta(days=9, seconds=30.5)
+
+        with (
+            patch("wrappers.cloud_monitoring.utils.first_day_of_current_month_utc", return_value=start),
+            patch("wrappers.cloud_monitoring.utils.now_utc", return_value=end),
+        ):
+            wrapper._query_time_series("test.metric", None, None)
+
+        request = wrapper.client.list_time_series.call_args.kwargs["request"]
+        assert request["aggregation"].alignment_period == timedelta(days=9, seconds=31)
+
+    def test_first_minute_of_month_not_queried(self):
+        """The aligned window must never reach back before the 1st."""
+        wrapper = self._make_wrapper()
+        wrapper.client = MagicMock()
+        start = datetime(2026, 3, 1, tzinfo=timezone.utc)
+
+        with (
+            patch("wrappers.cloud_monitoring.utils.first_day_of_current_month_utc", return_value=start),
+            patch("wrappers.cloud_monitoring.utils.now_utc", return_value=start + timedelta(seconds=59)),
+        ):
+            assert wrapper.get_total_units("test.metric") == 0
+
+        wrapper.client.list_time_series.assert_not_called()
+
+    def test_quota_error_opens_circuit(self):
+        """After a quota error, later queries fail fast without an RPC."""
+        wrapper = self._make_wrapper()
+        wrapper.client = MagicMock()
+        wrapper.client.list_time_series.side_effect = ResourceExhausted("quota")
+
+        with pytest.raises(ResourceExhausted):
+            wrapper.get_total_units("first.metric")
+        with pytest.raises(ServiceUnavailable):
+            wrapper.get_grouped_units("second.metric")
+
+        wrapper.client.list_time_series.assert_called_once()
+
+    def test_generic_error_keeps_circuit_closed(self):
+        wrapper = self._make_wrapper()
+        wrapper.client = MagicMock()
+        wrapper.client.list_time_series.side_effect = RuntimeError("boom")
+
+        wrapper.get_total_units("first.metric")
+        wrapper.get_total_units("second.metric")
+
+        assert wrapper.client.list_time_series.call_count == 2
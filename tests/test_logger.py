@@ -0,0 +1,78 @@
+"""Tests for helpers.logger."""
+
+import logging
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+from helpers import logger as logger_module
+from helpers.logger import GCPLogger, _PassthroughQueueHandler
+
+
+def test_disabled_level_is_not_dispatched():
+    logger = GCPLogger()
+    with patch.object(logger.logger, "isEnabledFor", return_value=False), \
+            patch.object(logger.logger, "log") as mock_log:
+        logger.debug(msg="hidden")
+    mock_log.assert_not_called()
+
+
+def test_enabled_level_is_dispatched():
+    logger = GCPLogger()
+    with patch.object(logger.logger, "log") as mock_log:
+        logger.error(msg="shown", code=1)
+    mock_log.assert_called_once_with(logging.ERROR, {"message": "shown", "code": 1})
+
+
+def test_is_enabled_for_follows_logger_level():
+    logger = GCPLogger()
+    assert logger.isEnabledFor(logging.CRITICAL)
+
+
+def test_queue_handler_keeps_structured_message():
+    """Records must reach JSONFormatter with their dict payload intact."""
+    handler = _PassthroughQueueHandler(MagicMock())
+    record = logging.LogRecord("x", logging.INFO, __file__, 1, {"message": "m"}, None, None)
+    handler.emit(record)
+    handler.queue.put_nowait.assert_called_once_with(record)
+    assert record.msg == {"message": "m"}
+
+
+def test_records_written_synchronously_after_stop():
+    logger = GCPLogger()
+    logger.stop()
+    try:
+        with patch.object(logger_module._listener, "handle") as mock_handle:
+            logger.info(msg="late")
+        mock_handle.assert_called_once()
+        assert mock_handle.call_args.args[0].msg["message"] == "late"
+    finally:
+        logger.start()
+
+
+def test_record_enqueued_during_stop_is_not_lost():
+    """stop() must not slip its sentinel in ahead of an in-flight enqueue."""
+    logger = GCPLogger()
+    handler = logger.logger.handlers[0]
+    real_queue = handler.queue
+    enqueuing = threading.Event()
+    written: list[logging.LogRecord] = []
+
+    def slow_put(record):
+        enqueuing.set()
+        time.sleep(0.1)
+        real_queue.put_nowait(record)
+
+    slow_queue = MagicMock()
+    slow_queue.put_nowait.side_effect = slow_put
+    stream_handler = logger_module._listener.handlers[0]
+    with patch.object(handler, "queue", slow_queue), \
+            patch.object(stream_handler, "handle", side_effect=written.append):
+        writer = threading.Thread(target=logger.info, kwargs={"msg": "in flight"})
+        writer.start()
+        enqueuing.wait(timeout=5)
+        logger.stop()
+        writer.join()
+    logger.start()
+
+    assert [r.msg["message"] for r in written] == ["in flight"]
@@ -1,8 +1,11 @@
 """Unit tests for config.monitored_services and config.monitored_services_list."""
 
+import pytest
+
 from config.monitored_services import MonitoredMetric
 from config.monitored_services_list import (
     BIGQUERY_METRICS,
+    BILLING_SERVICE_IDS,
     FIRESTORE_METRICS,
     SERVICE_METRICS,
     VERTEX_AI_METRICS,
@@ -22,7 +25,7 @@ class TestMonitoredMetric:
         assert m.unit_count == 0
         assert m.expense == 0.0
         assert m.is_catch_all is False
-        assert m.group_by_fields == []
+        assert m.group_by_fields == ()
 
     def test_catch_all_flag_in_as_dict(self):
         m = MonitoredMetric(label="ca", metric_name="m", is_catch_all=True)
@@ -41,6 +44,16 @@ class TestServiceMetricsRegistry:
         assert "bigquery" in SERVICE_METRICS
         assert "firestore" in SERVICE_METRICS
 
+    def test_registry_is_read_only(self):
+        with pytest.raises(TypeError):
+            SERVICE_METRICS["new"] = ()
+        assert all(isinstance(v, tuple) for v in SERVICE_METRICS.values())
+
+    def test_billing_service_ids_cover_all_services(self):
+        assert BILLING_SERVICE_IDS == {
+            "C7E2-9256-1C43", "24E6-581D-38E5", "EE2C-7FAC-5E08"
+        }
+
     def test_vertex_ai_has_metrics(self):
         assert len(VERTEX_AI_METRICS) >= 1
 
@@ -108,7 +121,7 @@ class TestVertexAISubServiceMetrics:
         assert len(non_catch_all) == 7
         for m in non_catch_all:
             assert m.is_catch_all is False
-            assert m.group_by_fields == []
+            assert m.group_by_fields == ()
 
     def test_sub_services_have_billing_ids(self):
         """Every sub-service metric must have billing_service_id and billing_sku_id."""
@@ -1,10 +1,18 @@
 """Unit tests for the notification service (email + Pub/Sub with per-service alert counter)."""
 
+import email
 import json
+import smtplib
+import threading
+from email.header import decode_header, make_header
 from unittest.mock import MagicMock, patch
 
 from config.budget import ServiceBudget
-from services.notification import NotificationService
+from services.notification import (
+    NotificationService,
+    _format_timestamps,
+    _render_email,
+)
 
 
 class TestNotificationService:
@@ -40,9 +48,32 @@ class TestNotificationService:
         with patch.object(svc, "_send_email", return_value=True) as mock_send:
             with patch.object(svc, "_publish_to_pubsub", return_value=False):
                 result = svc.send_warning_alert(self._make_svc())
+                svc.flush()
                 assert result is True
                 mock_send.assert_called_once()
 
+    @patch("services.notification.SMTP_EMAIL", "test@gmail.com")
+    @patch("services.notification.SMTP_APP_PASSWORD", "password123")
+    @patch("services.notification.ALERT_RECEIVER_EMAILS", ["admin@company.com"])
+    def test_pubsub_publish_overlaps_email(self):
+        """Pub/Sub runs off the caller's thread while the email is sent."""
+        svc = NotificationService()
+        publish_started = threading.Event()
+
+        def send_email(subject, body):
+            # Only returns once the publish is already in flight
+            return publish_started.wait(timeout=5)
+
+        def publish(level, budget, disabled):
+            publish_started.set()
+            return True
+
+        with patch.object(svc, "_send_email", side_effect=send_email):
+            with patch.object(svc, "_publish_to_pubsub", side_effect=publish):
+                assert svc.send_warning_alert(self._make_svc()) is True
+                svc.flush()
+        assert publish_started.is_set()
+
     @patch("services.notification.SMTP_EMAIL", "test@gmail.com")
     @patch("services.notification.SMTP_APP_PASSWORD", "password123")
     @patch("services.notification.ALERT_RECEIVER_EMAILS", ["admin@company.com"])
@@ -52,6 +83,7 @@ class TestNotificationService:
         with patch.object(svc, "_send_email", return_value=True):
             with patch.object(svc, "_publish_to_pubsub", return_value=False):
                 result1 = svc.send_warning_alert(self._make_svc())
+                svc.flush()
                 assert result1 is True
                 assert svc.get_alert_count("vertex_ai") == 1
 
@@ -68,6 +100,7 @@ class TestNotificationService:
         with patch.object(svc, "_send_email", return_value=True) as mock_send:
             with patch.object(svc, "_publish_to_pubsub", return_value=False):
                 svc.send_critical_alert(self._make_svc(), disabled=True)
+                svc.flush()
                 call_args = mock_send.call_args
                 body = call_args[0][1]
                 assert "Service Disabled" in body
@@ -94,7 +127,9 @@ class TestNotificationService:
         with patch.object(svc, "_send_email", return_value=True):
             with patch.object(svc, "_publish_to_pubsub", return_value=False):
                 svc.send_warning_alert(self._make_svc(expense=85.0))
+                svc.flush()
                 svc.send_critical_alert(self._make_svc(), disabled=True)
+                svc.flush()
                 assert svc.get_alert_count("vertex_ai") == 2
 
                 r1 = svc.send_warning_alert(self._make_svc(expense=85.0))
@@ -111,12 +146,14 @@ class TestNotificationService:
         with patch.object(svc, "_send_email", return_value=True):
             with patch.object(svc, "_publish_to_pubsub", return_value=False):
                 svc.send_warning_alert(self._make_svc())
+                svc.flush()
                 assert svc.get_alert_count("vertex_ai") == 1
 
                 svc.reset_alerts("vertex_ai")
                 assert svc.get_alert_count("vertex_ai") == 0
 
                 result = svc.send_warning_alert(self._make_svc())
+                svc.flush()
                 assert result is True
                 assert svc.get_alert_count("vertex_ai") == 1
 
@@ -135,13 +172,123 @@ class TestNotificationService:
                     current_expense=120.0,
                 )
                 svc.send_warning_alert(self._make_svc())
+                svc.flush()
                 assert svc.get_alert_count("vertex_ai") == 1
                 assert svc.get_alert_count("bigquery") == 0
 
                 svc.send_warning_alert(svc_bq)
+                svc.flush()
                 assert svc.get_alert_count("vertex_ai") == 1
                 assert svc.get_alert_count("bigquery") == 1
 
+    @patch("services.notification.SMTP_EMAIL", "test@gmail.com")
+    @patch("services.notification.SMTP_APP_PASSWORD", "password123")
+    @patch("services.notification.ALERT_RECEIVER_EMAILS", ["admin@company.com"])
+    def test_alert_delivered_off_caller_thread(self):
+        """send_*_alert returns before delivery; flush() waits for it."""
+        svc = NotificationService()
+        release = threading.Event()
+        delivered_on: list[str] = []
+
+        def send_email(subject, body):
+            release.wait(timeout=5)
+            delivered_on.append(threading.current_thread().name)
+            return True
+
+        with patch.object(svc, "_send_email", side_effect=send_email):
+            with patch.object(svc, "_publish_to_pubsub", return_value=False):
+                assert svc.send_warning_alert(self._make_svc()) is True
+                assert delivered_on == []
+                release.set()
+                svc.flush()
+
+        assert delivered_on == ["alert-delivery"]
+
+    @patch("services.notification.SMTP_EMAIL", "test@gmail.com")
+    @patch("services.notification.SMTP_APP_PASSWORD", "password123")
+    @patch("services.notification.ALERT_RECEIVER_EMAILS", ["admin@company.com"])
+    def test_failed_delivery_uncounts_alert(self):
+        """If no channel delivers, the level may be queued again next cycle."""
+        state = MagicMock()
+        state.get_alerts_sent.return_value = {}
+        svc = NotificationService(state_manager=state)
+        with patch.object(svc, "_send_email", return_value=False):
+            with patch.object(svc, "_publish_to_pubsub", return_value=False):
+                assert svc.send_warning_alert(self._make_svc()) is True
+                svc.flush()
+
+        assert svc.get_alert_count("vertex_ai") == 0
+        state.set_alert_sent.assert_not_called()
+
+    @patch("services.notification.SMTP_EMAIL", "test@gmail.com")
+    @patch("services.notification.SMTP_APP_PASSWORD", "password123")
+    @patch("services.notification.ALERT_RECEIVER_EMAILS", ["admin@company.com"])
+    def test_alerts_drained_together_publish_concurrently(self):
+        """Every publish of a drained batch is in flight at the same time."""
+        state = MagicMock()
+        state.get_alerts_sent.return_value = {}
+        svc = NotificationService(state_manager=state)
+        both_publishing = threading.Barrier(2, timeout=5)
+
+        def publish(level, budget, disabled):
+            both_publishing.wait()
+            return True
+
+        bq = ServiceBudget(
+            service_key="bigquery",
+            api_name="bigquery.googleapis.com",
+            monthly_budget=100.0,
+            current_expense=120.0,
+        )
+        with patch.object(svc, "_send_email", return_value=False):
+            with patch.object(svc, "_publish_to_pubsub", side_effect=publish):
+                svc._deliver_batch(
+                    [(self._make_svc(), "WARNING", False), (bq, "WARNING", False)]
+                )
+
+        assert state.set_alert_sent.call_count == 2
+
+    @patch("services.notification.SMTP_EMAIL", "test@gmail.com")
+    @patch("services.notification.SMTP_APP_PASSWORD", "password123")
+    @patch("services.notification.ALERT_RECEIVER_EMAILS", ["admin@company.com"])
+    def test_worker_started_lazily_and_stopped_by_close(self):
+        with patch("services.notification.atexit") as mock_atexit:
+            svc = NotificationService()
+            assert svc._worker is None
+
+            with patch.object(svc, "_send_email", return_value=True):
+                with patch.object(svc, "_publish_to_pubsub", return_value=False):
+                    svc.send_warning_alert(self._make_svc())
+                    worker = svc._worker
+                    svc.close()
+
+        assert not worker.is_alive()
+        assert svc._worker is None
+        assert svc.get_alert_count("vertex_ai") == 1
+        mock_atexit.unregister.assert_any_call(svc.flush)
+        registered = [c.args[0] for c in mock_atexit.register.call_args_list]
+        unregistered = [c.args[0] for c in mock_atexit.unregister.call_args_list]
+        assert set(registered) == set(unregistered)
+
+    def test_html_body_fills_every_field(self):
+        svc = NotificationService()
+        body = svc._html_body("CRITICAL", self._make_svc(), disabled=True)
+
+        assert "$100.00" in body
+        assert "$120.0000" in body
+        assert "120.0%" in body
+        assert "POST /enable_service/aiplatform.googleapis.com" in body
+        assert "$service_key" not in body and "$colour" not in body
+
+    def test_timestamps_formatted_once_per_second(self):
+        _format_timestamps.cache_clear()
+        email_ts, iso_ts = _format_timestamps(1_780_000_000)
+
+        assert email_ts == "2026-05-28 20:26:40 UTC"
+        assert iso_ts == "2026-05-28T20:26:40+00:00"
+        assert _format_timestamps(1_780_000_000) == (email_ts, iso_ts)
+        assert _format_timestamps.cache_info().hits == 1
+
 
 class TestMultipleEmailRecipients:
     """Verify that all addresses in ALERT_RECEIVER_EMAILS receive the alert.
@@ -161,11 +308,11 @@ class TestMultipleEmailRecipients:
         )
 
     def _smtp_mock(self):
-        """Return (mock_ssl_class, mock_server_instance) pre-wired as context manager."""
-        mock_server = MagicMock()
+        """Return (mock_ssl_class, mock_server_instance) for the cached connection."""
         mock_ssl_class = MagicMock()
-        mock_ssl_class.return_value.__enter__ = MagicMock(return_value=mock_server)
-        mock_ssl_class.return_value.__exit__ = MagicMock(return_value=False)
+        mock_server = mock_ssl_class.return_value
+        mock_server.noop.return_value = (250, b"OK")
+        mock_server.sendmail.return_value = {}
         return mock_ssl_class, mock_server
 
     @patch("services.notification.SMTP_EMAIL", "sender@gmail.com")
@@ -180,6 +327,7 @@ class TestMultipleEmailRecipients:
         with patch("services.notification.smtplib.SMTP_SSL", mock_ssl_class):
             with patch.object(svc, "_publish_to_pubsub", return_value=False):
                 svc.send_warning_alert(self._make_svc(expense=85.0))
+                svc.flush()
 
         mock_server.sendmail.assert_called_once()
         # second positional arg to sendmail() is the to_addrs list
@@ -207,6 +355,7 @@ class TestMultipleEmailRecipients:
         with patch("services.notification.smtplib.SMTP_SSL", mock_ssl_class):
             with patch.object(svc, "_publish_to_pubsub", return_value=False):
                 svc.send_warning_alert(self._make_svc(expense=85.0))
+                svc.flush()
 
         assert captured_message, "sendmail was not called"
         raw_msg = captured_message[0]
@@ -227,6 +376,7 @@ class TestMultipleEmailRecipients:
         with patch("services.notification.smtplib.SMTP_SSL", mock_ssl_class):
             with patch.object(svc, "_publish_to_pubsub", return_value=False):
                 result = svc.send_critical_alert(self._make_svc(), disabled=True)
+                svc.flush()
 
         assert result is True
         mock_server.sendmail.assert_called_once()
@@ -246,11 +396,76 @@ class TestMultipleEmailRecipients:
         with patch("services.notification.smtplib.SMTP_SSL", mock_ssl_class):
             with patch.object(svc, "_publish_to_pubsub", return_value=False):
                 result = svc.send_warning_alert(self._make_svc(expense=85.0))
+                svc.flush()
 
         assert result is True
         to_addrs = mock_server.sendmail.call_args[0][1]
         assert to_addrs == ["single@company.com"]
 
+    @patch("services.notification.SMTP_EMAIL", "sender@gmail.com")
+    @patch("services.notification.SMTP_APP_PASSWORD", "app-password")
+    @patch("services.notification.ALERT_RECEIVER_EMAILS", ["ok@company.com", "bad@company.com"])
+    def test_partial_recipient_refusal_still_counts_as_sent(self):
+        """One refused address does not fail delivery to the others."""
+        mock_ssl_class, mock_server = self._smtp_mock()
+        mock_server.sendmail.return_value = {"bad@company.com": (550, b"No such user")}
+        svc = NotificationService()
+
+        with patch("services.notification.smtplib.SMTP_SSL", mock_ssl_class):
+            with patch("services.notification.APP_LOGGER") as mock_logger:
+                assert svc._send_email("subject", "<p>body</p>") is True
+
+        mock_server.sendmail.assert_called_once()
+        warning = mock_logger.warning.call_args.kwargs["msg"]
+        assert "bad@company.com" in warning
+
+    @patch("services.notification.SMTP_EMAIL", "sender@gmail.com")
+    @patch("services.notification.SMTP_APP_PASSWORD", "app-password")
+    @patch("services.notification.ALERT_RECEIVER_EMAILS", ["single@company.com"])
+    def test_connection_reused_across_alerts(self):
+        """A second alert goes out over the same logged-in connection."""
+        mock_ssl_class, mock_server = self._smtp_mock()
+        svc = NotificationService()
+
+        with patch("services.notification.smtplib.SMTP_SSL", mock_ssl_class):
+            assert svc._send_email("first", "<p>1</p>") is True
+            assert svc._send_email("second", "<p>2</p>") is True
+
+        mock_ssl_class.assert_called_once()
+        mock_server.login.assert_called_once()
+        assert mock_server.sendmail.call_count == 2
+
+    @patch("services.notification.SMTP_EMAIL", "sender@gmail.com")
+    @patch("services.notification.SMTP_APP_PASSWORD", "app-password")
+    @patch("services.notification.ALERT_RECEIVER_EMAILS", ["single@company.com"])
+    def test_dead_connection_replaced(self):
+        """A connection that fails NOOP is closed and a new one is opened."""
+        mock_ssl_class, mock_server = self._smtp_mock()
+        svc = NotificationService()
+
+        with patch("services.notification.smtplib.SMTP_SSL", mock_ssl_class):
+            svc._send_email("first", "<p>1</p>")
+            mock_server.noop.side_effect = smtplib.SMTPServerDisconnected("gone")
+            assert svc._send_email("second", "<p>2</p>") is True
+
+        assert mock_ssl_class.call_count == 2
+
+    @patch("services.notification.SMTP_EMAIL", "sender@gmail.com")
+    @patch("services.notification.ALERT_RECEIVER_EMAILS", ["a@company.com", "b@company.com"])
+    def test_rendered_email_parses_back(self):
+        """The hand-built MIME text round-trips through the email parser."""
+        raw = _render_email("⚠️ [WARNING] vertex_ai at 85.0%", "<p>Budget – 85 %</p>")
+        raw.encode("ascii")  # 7-bit safe
+
+        msg = email.message_from_string(raw)
+        assert str(make_header(decode_header(msg["Subject"]))) == (
+            "⚠️ [WARNING] vertex_ai at 85.0%"
+        )
+        assert msg["From"] == "sender@gmail.com"
+        assert msg["To"] == "a@company.com, b@company.com"
+        assert msg.get_content_type() == "text/html"
+        assert msg.get_payload(decode=True).decode("utf-8") == "<p>Budget – 85 %</p>"
+
 
 class TestPubSubIntegration:
     """Tests for Pub/Sub alert publishing."""
@@ -294,6 +509,25 @@ class TestPubSubIntegration:
         assert "action_taken" in data
         assert "re_enable_endpoint" in data
 
+    def test_pubsub_routing_fields_sent_as_attributes(self):
+        """Subscribers can filter on attributes without decoding the body."""
+        svc = NotificationService()
+        mock_publisher = MagicMock()
+        mock_publisher.publish.return_value.result.return_value = "msg-1"
+        svc._pubsub_enabled = True
+        svc._publisher = mock_publisher
+        svc._topic_path = "projects/test/topics/test"
+
+        svc._publish_to_pubsub("CRITICAL", self._make_svc(), disabled=True)
+
+        attrs = mock_publisher.publish.call_args.kwargs
+        assert attrs["alert_type"] == "CRITICAL"
+        assert attrs["service_key"] == "vertex_ai"
+        assert attrs["api_name"] == "aiplatform.googleapis.com"
+        assert attrs["service_disabled"] == "true"
+        assert attrs["usage_pct"] == "120.00"
+        assert all(isinstance(v, str) for k, v in attrs.items() if k != "data")
+
     def test_pubsub_disabled_returns_false(self):
         """When Pub/Sub is not configured, publish should return False."""
         svc = NotificationService()
@@ -352,5 +586,6 @@ class TestPubSubIntegration:
         svc._topic_path = "projects/test/topics/test"
 
         result = svc.send_warning_alert(self._make_svc(expense=85.0))
+        svc.flush()
         assert result is True
         mock_publisher.publish.assert_called_once()
@@ -169,6 +169,18 @@ class TestPriceCatalogService:
         assert price is not None
         assert abs(price - 1.25e-6) < 1e-10
 
+    def test_model_prices_precomputed_at_load(self):
+        """Per-token model prices should be resolved once, at load time."""
+        catalog = PriceCatalogService()
+        assert catalog._model_prices[("gemini-2.5-pro", "output")] == 10.0 / 1_000_000
+
+    def test_sku_prices_precomputed_at_load(self):
+        """Per-base-unit SKU prices should be resolved once, at load time."""
+        catalog = PriceCatalogService()
+        assert catalog._price_index.keys() == catalog._sku_index.keys()
+        for sku_id, price in catalog._price_index.items():
+            assert catalog.get_price_per_base_unit("any", sku_id) == price
+
     def test_model_price_known_claude(self):
         """Known Claude model should return exact per-token price."""
         catalog = PriceCatalogService()
@@ -123,6 +123,36 @@ class TestFallbackPriceProvider:
 
         assert price is None
 
+    def test_prefetch_delegates_to_primary_and_swallows_errors(self):
+        primary = MagicMock(spec=PriceProvider)
+        primary.provider_name = "primary"
+        primary.prefetch.side_effect = Exception("billing API down")
+        fallback = MagicMock(spec=PriceProvider)
+        fallback.provider_name = "fallback"
+
+        provider = FallbackPriceProvider(primary=primary, fallback=fallback)
+        provider.prefetch({"svc"})
+
+        primary.prefetch.assert_called_once_with({"svc"})
+        fallback.prefetch.assert_not_called()
+
+    def test_get_prices_bulk_loads_each_service_once(self):
+        primary = MagicMock(spec=PriceProvider)
+        primary.provider_name = "primary"
+        primary.get_price_per_unit.side_effect = [0.1, None]
+        fallback = MagicMock(spec=PriceProvider)
+        fallback.provider_name = "fallback"
+        fallback.get_price_per_unit.return_value = 0.2
+
+        provider = FallbackPriceProvider(primary=primary, fallback=fallback)
+        prices = provider.get_prices_bulk(
+            [("svc", "a", 0), ("svc", "b", 0), ("svc", "a", 0)]
+        )
+
+        assert prices == {("svc", "a", 0): 0.1, ("svc", "b", 0): 0.2}
+        primary.prefetch.assert_called_once_with({"svc"})
+        assert primary.get_price_per_unit.call_count == 2
+
     def test_provider_name_format(self):
         primary = MagicMock(spec=PriceProvider)
         primary.provider_name = "cloud_billing"
@@ -3,6 +3,7 @@
 import json
 import os
 import tempfile
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -97,6 +98,19 @@ class TestStateManager:
         mgr2 = StateManager(state_path=self.state_path)
         assert "CRITICAL" in mgr2.get_alerts_sent()["vertex_ai"]
 
+    # ── Disabled Services ─────────────────────────────────────────────
+
+    def test_disabled_services_round_trip(self):
+        self.mgr.set_service_disabled("bigquery", True)
+        self.mgr.set_service_disabled("bigquery", True)
+        assert self.mgr.get_disabled_services() == ["bigquery"]
+
+        mgr2 = StateManager(state_path=self.state_path)
+        assert mgr2.get_disabled_services() == ["bigquery"]
+
+        self.mgr.set_service_disabled("bigquery", False)
+        assert self.mgr.get_disabled_services() == []
+
     # ── Action History ────────────────────────────────────────────────
 
     def test_action_history_empty_by_default(self):
@@ -121,6 +135,7 @@ class TestStateManager:
         self.mgr.set_baseline("vertex_ai", 100.0)
         self.mgr.set_alert_sent("vertex_ai", "WARNING")
         self.mgr.set_last_known_cost("vertex_ai", 100.0)
+        self.mgr.set_service_disabled("vertex_ai", True)
 
         # Simulate a different month
         self.mgr._state["current_month"] = "1999-01"
@@ -130,6 +145,7 @@ class TestStateManager:
         assert self.mgr.get_baseline("vertex_ai") == 0.0
         assert self.mgr.get_alerts_sent() == {}
         assert self.mgr.get_last_known_cost("vertex_ai") is None
+        assert self.mgr.get_disabled_services() == []
 
     def test_same_month_no_rollover(self):
         self.mgr.check_month_rollover()  # set current month
@@ -312,3 +328,48 @@ class TestStateManagerGCS:
 
         assert mgr.get_last_known_cost("vertex_ai") == pytest.approx(123.456)
         mock_blob.upload_from_string.assert_called()
+
+    @patch("services.state_manager.StateManager._get_gcs_bucket")
+    def test_gcs_batch_uploads_once(self, mock_get_bucket):
+        """Writes inside batch() are coalesced into a single upload."""
+        mock_bucket, mock_blob = self._make_mock_bucket(existing_data=None)
+        mock_get_bucket.return_value = mock_bucket
+
+        mgr = StateManager(bucket_name="test-bucket", blob_name="state.json")
+        with mgr.batch():
+            mgr.set_last_known_cost("vertex_ai", 1.0)
+            mgr.set_last_known_cost("bigquery", 2.0)
+            mgr.set_alert_sent("vertex_ai", "WARNING")
+            mock_blob.upload_from_string.assert_not_called()
+
+        mock_blob.upload_from_string.assert_called_once()
+        assert mgr.get_last_known_cost("bigquery") == pytest.approx(2.0)
+
+    @patch("services.state_manager.StateManager._get_gcs_bucket")
+    def test_gcs_batch_does_not_defer_other_threads(self, mock_get_bucket):
+        """A write from another thread persists while a batch is open."""
+        mock_bucket, mock_blob = self._make_mock_bucket(existing_data=None)
+        mock_get_bucket.return_value = mock_bucket
+
+        mgr = StateManager(bucket_name="test-bucket", blob_name="state.json")
+        with mgr.batch():
+            mgr.set_last_known_cost("vertex_ai", 1.0)
+            worker = threading.Thread(
+                target=mgr.set_alert_sent, args=("bigquery", "WARNING")
+            )
+            worker.start()
+            worker.join()
+            mock_blob.upload_from_string.assert_called_once()
+
+        assert mock_blob.upload_from_string.call_count == 2
+
+    @patch("services.state_manager.StateManager._get_gcs_bucket")
+    def test_gcs_unchanged_last_known_cost_not_uploaded(self, mock_get_bucket):
+        mock_bucket, mock_blob = self._make_mock_bucket(existing_data=None)
+        mock_get_bucket.return_value = mock_bucket
+
+        mgr = StateManager(bucket_name="test-bucket", blob_name="state.json")
+        mgr.set_last_known_cost("vertex_ai", 1.0)
+        mgr.set_last_known_cost("vertex_ai", 1.0)
+
+        mock_blob.upload_from_string.assert_called_once()